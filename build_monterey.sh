@@ -166,6 +166,7 @@ build_application() {
     # Build with PyInstaller
     ./venv_monterey/bin/pyinstaller --noconfirm --windowed --name="sldl-gui" \
         --add-binary="bin/sldl:bin" \
+        --collect-data certifi \
         --icon=icon.icns \
         --osx-entitlements-file="entitlements.plist" \
         sldl-gui-macos.py
@@ -1,19 +1,30 @@
 #!/usr/bin/env python3
 """sldl-gui for macOS - PyObjC GUI version."""
 
+import concurrent.futures
+import csv
+import os
+import shlex
+import shutil
+import signal
 import subprocess
 import threading
 import json
 import sys
 import re
+import tempfile
 import unicodedata
 import urllib.request
 import urllib.error
 import urllib.parse
 import ssl
+import platform
 import datetime
+import time
 from pathlib import Path
 
+import certifi
+
 # Application version
 APP_VERSION = "0.3.6"
 
@@ -27,12 +38,13 @@ try:
         NSWindowStyleMaskTitled, NSWindowStyleMaskClosable,
         NSWindowStyleMaskResizable, NSBackingStoreBuffered,
         NSOpenPanel, NSSavePanel, NSObject, NSApplicationActivationPolicyRegular,
-        NSString, NSAlert, NSAlertFirstButtonReturn, NSAlertSecondButtonReturn, NSModalResponseOK, NSPopUpButton,
-        NSButtonTypeSwitch, NSMenu, NSMenuItem, NSColor,
+        NSAlert, NSAlertFirstButtonReturn, NSAlertSecondButtonReturn, NSModalResponseOK, NSPopUpButton,
+        NSButtonTypeSwitch, NSMenu, NSMenuItem, NSColor, NSFont,
         NSFontAttributeName, NSForegroundColorAttributeName,
         NSBezelStyleRounded, NSTextFieldRoundedBezel,
         NSViewWidthSizable, NSViewHeightSizable, NSViewMinXMargin,
-        NSViewMaxXMargin, NSViewMinYMargin, NSViewMaxYMargin, NSThread
+        NSViewMaxXMargin, NSViewMinYMargin, NSViewMaxYMargin, NSThread,
+        NSRunLoopCommonModes, NSAttributedString, NSWindowOcclusionStateVisible
     )
     # Import termination reply constants from AppKit for applicationShouldTerminate_
     try:
@@ -45,11 +57,200 @@ except ImportError as e:
     print("Please install PyObjC with: pip install pyobjc-framework-Cocoa")
     sys.exit(1)
 
+# Autoresizing masks shared by the main window controls. Cocoa's y axis points
+# up, so a flexible bottom margin (NSViewMinYMargin) keeps a control pinned to
+# the top edge of the window.
+MASK_WIDTH_TOP = NSViewWidthSizable | NSViewMinYMargin      # stretch, pinned to top
+MASK_RIGHT_TOP = NSViewMinXMargin | NSViewMinYMargin        # pinned to top-right
+MASK_LEFT_BOTTOM = NSViewMaxXMargin | NSViewMaxYMargin      # pinned to bottom-left
+MASK_WIDTH_BOTTOM = NSViewWidthSizable | NSViewMaxYMargin   # stretch, pinned to bottom
+MASK_FILL = NSViewWidthSizable | NSViewHeightSizable        # grows with the window
+
 SETTINGS_FILE = Path.home() / ".soulseek_downloader_settings.json"
 WISHLIST_FILE = Path.home() / ".soulseek_downloader_wishlist.csv"
+UPDATE_CACHE_FILE = Path.home() / ".soulseek_downloader_update_cache.json"
+
+# How long a successful update check is reused before GitHub is asked again
+UPDATE_CACHE_TTL = datetime.timedelta(hours=6)
+# After GitHub refuses an update check (403/429 rate limiting) no request is sent for
+# UPDATE_BACKOFF_BASE, doubling on each further refusal up to UPDATE_BACKOFF_MAX
+UPDATE_BACKOFF_BASE = datetime.timedelta(seconds=30)
+UPDATE_BACKOFF_MAX = datetime.timedelta(hours=1)
+# Per-operation socket timeout (connect, TLS handshake, each read) for GitHub requests
+NETWORK_TIMEOUT = 5
+
+# One certificate-verifying TLS context for every GitHub request. It trusts certifi's CA
+# bundle, which the build copies into the app: OpenSSL's default CA path points at the
+# build machine and doesn't exist on users' Macs
+SSL_CONTEXT = ssl.create_default_context(cafile=certifi.where())
+
+# Output appended within this many seconds is laid out in a single text storage edit
+OUTPUT_FLUSH_INTERVAL = 0.05
+# Once the output view holds more than OUTPUT_MAX_LENGTH characters, the oldest lines
+# are dropped until about OUTPUT_TRIM_LENGTH remain (the gap keeps trims infrequent)
+OUTPUT_MAX_LENGTH = 500_000
+OUTPUT_TRIM_LENGTH = 400_000
+
+# Shared worker threads for short background I/O (disk reads, network checks, cleanup).
+# Stopping sldl gets its own thread so a stalled job here can't delay the SIGKILL
+BACKGROUND_EXECUTOR = concurrent.futures.ThreadPoolExecutor(max_workers=2, thread_name_prefix="sldl-gui")
+# A `sldl --version` that hasn't answered after this many seconds counts as sldl not working
+SLDL_VERSION_TIMEOUT = 10
+
+# sldl writes its index next to the downloads, normally in the playlist folder
+# directly below --path, so a shallow scan is enough in the common case.
+INDEX_FILENAME = "_index.csv"
+INDEX_SCAN_DEPTH = 2
+
+# Buffer size for whole-file passes over index and log CSVs, so large files take few read/write calls
+CSV_IO_BUFFER = 1 << 20
+
+# One line of `sldl --print tracks` output: "Artist - Title" with an optional "(123s)" duration
+TRACK_LINE_RE = re.compile(r'^\s*(?P<artist>.+?) - (?P<title>.+?)(?:\s*\((?P<duration>\d+)s\))?\s*$')
+# The trailing "(123s)" duration on such a line
+TRACK_DURATION_RE = re.compile(r'\s*\(\d+s\)$')
+# The artist=/title= fields of an sldl "artist=...,title=..." track string
+TRACK_PARAM_RE = re.compile(r'(?:^|,)(artist|title)=([^,]*)')
+# Runs of anything but ASCII letters and digits, replaced by one space in clean searches
+NON_ALNUM_RUN_RE = re.compile(r'[^A-Za-z0-9]+')
+
+# Numeric components of a release tag such as "v0.3.10"
+VERSION_NUMBER_RE = re.compile(r'\d+')
+
+# Progress lines in sldl's download output, matched against every line it prints
+TOTAL_TRACKS_RE = re.compile(r'Downloading (\d+) tracks:')
+WISHLIST_ITEMS_RE = re.compile(r'Processing (\d+) items')
+COMPLETED_RE = re.compile(r'Completed: (.*)')
+
+# Column layout of the CSV files written by "Output to .csv"
+YOUTUBE_EXPORT_FIELDS = ('title', 'artist', 'duration', 'url', 'uploader')
+SPOTIFY_EXPORT_FIELDS = ('title', 'artist', 'album', 'duration', 'url')
+
+# Basic sanity checks for playlist URLs, keyed by source name
+PLAYLIST_URL_PATTERNS = {
+    "YouTube Playlist": re.compile(r'youtube\.com|youtu\.be', re.IGNORECASE),
+    "Spotify Playlist": re.compile(r'spotify\.com', re.IGNORECASE),
+}
+
+# Menu bar contents: (menu title, items), where each item is (title, action, key
+# equivalent) or None for a separator. The first menu is the application menu,
+# which macOS titles with the app name. Actions without a target travel the
+# responder chain, so the Edit items reach the focused field and the rest
+# reach the app delegate.
+MAIN_MENU_LAYOUT = (
+    ("", (
+        ("Quit sldl-gui", "terminate:", "q"),
+    )),
+    ("Edit", (
+        ("Cut", "cut:", "x"),
+        ("Copy", "copy:", "c"),
+        ("Paste", "paste:", "v"),
+        None,
+        ("Select All", "selectAll:", "a"),
+    )),
+    ("Extra Tools", (
+        ("Output to .csv", "outputToCSV:", ""),
+        ("Import wishlist from SoulseekQT", "importWishlistFromSoulseekQT:", ""),
+    )),
+    ("Bugs", (
+        ("Known bugs", "showKnownBugs:", ""),
+        ("Report bug", "reportBug:", ""),
+    )),
+    ("Acknowledgements", (
+        ("Show Acknowledgements", "showAcknowledgements:", ""),
+        None,
+        ("Visit sldl (slsk-batchdl) Repository", "openSldlUrl:", ""),
+        ("Visit fiso64's GitHub Profile", "openFiso64Url:", ""),
+        None,
+        ("Visit this project's repository", "openProjectUrl:", ""),
+    )),
+)
+
+# Choices for the preferred and strict format popups; "Any" means no --format flag
+AUDIO_FORMATS = (
+    "Any", "mp3", "flac", "wav", "m4a", "aac", "ogg", "opus",
+    "wma", "ape", "alac", "aiff", "wv", "shn", "tak", "tta",
+)
+
+# Optional numeric form fields passed straight through to sldl when they hold digits
+NUMERIC_SLDL_OPTIONS = (
+    ('listen_port', '--listen-port'),
+    ('pref_min_bitrate', '--pref-min-bitrate'),
+    ('pref_max_bitrate', '--pref-max-bitrate'),
+    ('strict_min_bitrate', '--min-bitrate'),
+    ('strict_max_bitrate', '--max-bitrate'),
+)
+
+def _file_stamp(path):
+    """Return a (inode, mtime_ns, size) tuple that changes whenever path is rewritten or replaced."""
+    st = os.stat(path)
+    return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+def _read_update_cache():
+    """Return the saved result of the last update check, or {} if there is none."""
+    try:
+        with open(UPDATE_CACHE_FILE, 'r') as f:
+            cache = json.load(f)
+        if isinstance(cache, dict):
+            return cache
+    except (OSError, ValueError):
+        pass
+    return {}
+
+def _update_cache_is_fresh(cache):
+    """Return True if the cached update check is younger than UPDATE_CACHE_TTL."""
+    try:
+        checked_at = datetime.datetime.fromisoformat(cache['checked_at'])
+        age = datetime.datetime.now(datetime.timezone.utc) - checked_at
+        return datetime.timedelta(0) <= age < UPDATE_CACHE_TTL
+    except (ValueError, KeyError, TypeError):
+        return False
+
+def _update_check_backed_off(cache):
+    """Return True while an earlier rate-limited update check says not to ask GitHub yet."""
+    try:
+        next_allowed_at = datetime.datetime.fromisoformat(cache['next_allowed_at'])
+        return datetime.datetime.now(datetime.timezone.utc) < next_allowed_at
+    except (ValueError, KeyError, TypeError):
+        return False
+
+def _record_update_backoff(cache, error):
+    """Save when the update check may next contact GitHub after a rate-limit refusal."""
+    attempt = cache.get('backoff_attempt', 0) + 1
+    delay = min(UPDATE_BACKOFF_MAX, UPDATE_BACKOFF_BASE * 2 ** (attempt - 1))
+    retry_after = error.headers.get('Retry-After', '') if error.headers else ''
+    if retry_after.isdigit():
+        delay = max(delay, datetime.timedelta(seconds=int(retry_after)))
+    next_allowed_at = datetime.datetime.now(datetime.timezone.utc) + delay
+    try:
+        write_json_atomic(UPDATE_CACHE_FILE, {
+            **cache,
+            'next_allowed_at': next_allowed_at.isoformat(),
+            'backoff_attempt': attempt,
+        })
+    except OSError as e:
+        print(f"Could not cache update check backoff: {e}")
+
+def parse_version(version):
+    """Turn a version string such as "0.3.10" into (0, 3, 10) so versions compare numerically."""
+    return tuple(int(part) for part in VERSION_NUMBER_RE.findall(version))
+
+def _newer_version(latest_version):
+    """Return latest_version if it is newer than APP_VERSION, else None."""
+    if parse_version(latest_version) > parse_version(APP_VERSION):
+        return latest_version
+    return None
 
 def check_for_updates():
     """Check for updates by comparing current version with latest GitHub release."""
+    cache = _read_update_cache()
+    cached_version = cache.get('latest')
+    if cached_version and _update_cache_is_fresh(cache):
+        return _newer_version(cached_version)
+    if _update_check_backed_off(cache):
+        # Still rate limited; answer from the stale cache rather than open a connection
+        return _newer_version(cached_version) if cached_version else None
+
     try:
         # GitHub API endpoint for releases
         url = "https://api.github.com/repos/felixhj/sldl-gui-macos/releases/latest"
@@ -57,27 +258,147 @@ def check_for_updates():
         # Create request with User-Agent to avoid rate limiting
         req = urllib.request.Request(url)
         req.add_header('User-Agent', 'sldl-gui-macos')
-        
-        # Create SSL context that doesn't verify certificates (for macOS compatibility)
-        ssl_context = ssl.create_default_context()
-        ssl_context.check_hostname = False
-        ssl_context.verify_mode = ssl.CERT_NONE
+        # Ask GitHub to answer 304 with no body if the release is unchanged; these
+        # conditional requests don't count against the API rate limit
+        etag = cache.get('etag')
+        conditional = bool(cached_version and etag)
+        if conditional:
+            req.add_header('If-None-Match', etag)
         
         # Fetch latest release info
-        with urllib.request.urlopen(req, timeout=10, context=ssl_context) as response:
-            data = json.loads(response.read().decode())
-            latest_version = data['tag_name'].lstrip('v')  # Remove 'v' prefix if present
-            
-            # Compare versions
-            if latest_version != APP_VERSION:
-                return latest_version
-            return None
+        try:
+            with urllib.request.urlopen(req, timeout=NETWORK_TIMEOUT, context=SSL_CONTEXT) as response:
+                # json.loads detects the UTF-8 encoding of the bytes itself; no decode() copy needed
+                data = json.loads(response.read())
+                latest_version = data['tag_name'].lstrip('v')  # Remove 'v' prefix if present
+                etag = response.headers.get('ETag')
+        except urllib.error.HTTPError as e:
+            if e.code in (403, 429):
+                _record_update_backoff(cache, e)
+            if e.code != 304 or not conditional:
+                raise
+            latest_version = cached_version  # Not modified since the cached check
+
+        # Remember the answer so launches within UPDATE_CACHE_TTL skip the network
+        try:
+            write_json_atomic(UPDATE_CACHE_FILE, {
+                'checked_at': datetime.datetime.now(datetime.timezone.utc).isoformat(),
+                'latest': latest_version,
+                'etag': etag,
+            })
+        except OSError as e:
+            print(f"Could not cache update check result: {e}")
+        
+        # Only offer releases newer than this build, comparing versions numerically
+        return _newer_version(latest_version)
             
     except (urllib.error.URLError, urllib.error.HTTPError, json.JSONDecodeError, KeyError, ValueError) as e:
         # Silently fail on network errors or parsing issues
         print(f"Update check failed: {e}")
         return None
 
+def _stat_mtime(st):
+    """Default file_time for _scan_for_newest_file: the modification time."""
+    return st.st_mtime
+
+def _scan_for_newest_file(base_dir, max_depth, name_matches, file_time=_stat_mtime):
+    """Return (time, path) of the newest file whose name passes name_matches.
+
+    Walks base_dir with os.scandir, whose entries carry the file type so only
+    matching files cost a stat call. max_depth limits how many directory levels
+    below base_dir are entered; None means no limit. Symlinked directories are
+    not followed. file_time picks the timestamp to compare from a stat result.
+    """
+    newest = None
+    pending = [(str(base_dir), 0)]
+    while pending:
+        directory, depth = pending.pop()
+        try:
+            entries = os.scandir(directory)
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if max_depth is None or depth < max_depth:
+                            pending.append((entry.path, depth + 1))
+                    elif name_matches(entry.name):
+                        timestamp = file_time(entry.stat(follow_symlinks=False))
+                        if newest is None or timestamp > newest[0]:
+                            newest = (timestamp, entry.path)
+                except OSError:
+                    continue
+    return newest
+
+def _is_index_file(name):
+    """Name filter for _scan_for_newest_file matching sldl's index file."""
+    return name == INDEX_FILENAME
+
+def find_latest_index_file(base_dir, output_dir=None):
+    """Find the most recent sldl index file for a download.
+
+    Looks in the folder sldl was pointed at first, then a few levels below the
+    base download directory, and only falls back to a full recursive walk when
+    neither turns anything up.
+    """
+    for search_dir, depth in ((output_dir, 1), (base_dir, INDEX_SCAN_DEPTH), (base_dir, None)):
+        if search_dir is None:
+            continue
+        found = _scan_for_newest_file(search_dir, depth, _is_index_file)
+        if found:
+            return Path(found[1])
+    return None
+
+def write_json_atomic(path, data, **dump_kwargs):
+    """Write data as JSON to a temp file next to path, then rename it into place."""
+    path = Path(path)
+    # Encode up front so the temp file gets one write instead of one per JSON token
+    payload = json.dumps(data, **dump_kwargs).encode('utf-8')
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(payload)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+def probe_sldl(sldl_path):
+    """Run `sldl --version`; return the binary's (resolved path, mtime) if it works, else None."""
+    resolved = shutil.which(sldl_path) or sldl_path
+    try:
+        stamp = (resolved, os.stat(resolved).st_mtime)
+        subprocess.run([resolved, '--version'], capture_output=True, check=True, timeout=SLDL_VERSION_TIMEOUT)
+    except (subprocess.CalledProcessError, subprocess.TimeoutExpired, OSError):
+        return None
+    return stamp
+
+def redact_command(cmd):
+    """Return a copy of an sldl command with the value following --pass masked."""
+    return ['***' if i and cmd[i - 1] == '--pass' else arg for i, arg in enumerate(cmd)]
+
+def split_track_name(track):
+    """Split an "Artist - Title" or "artist=...,title=..." track string into (artist, title)."""
+    artist, sep, title = track.partition(' - ')
+    if sep:
+        return artist, title
+    if 'artist=' in track and 'title=' in track:
+        params = dict(TRACK_PARAM_RE.findall(track))
+        return params.get('artist', '').strip(), params.get('title', '').strip()
+    # Fallback: use the whole track as title
+    return "", track
+
+def format_duration(seconds):
+    """Format a duration in seconds (as printed by sldl) as M:SS, or '' if unknown."""
+    if not seconds:
+        return ""
+    minutes, remaining_seconds = divmod(int(seconds), 60)
+    return f"{minutes}:{remaining_seconds:02d}"
+
 class AppDelegate(NSObject):
     
     def applicationDidFinishLaunching_(self, notification):
@@ -85,9 +406,27 @@ class AppDelegate(NSObject):
         self.current_process = None
         self.download_running = False
         self.user_stopped = False
+        self.stop_event = threading.Event()  # Set when the user stops a running download
+        self.download_params = None  # Form snapshot taken when the current download started
         self.download_target_dir = None
+        self.sldl_output_dir = None  # Folder passed to sldl via --path for the current run
         self.session_logger = None  # Will be initialized when download starts
-
+        self._sldl_verified_stamp = None  # (path, mtime) of the last sldl binary that passed --version
+        self._sldl_launch_probe = None  # Future of the probe_sldl started at launch, until _sldlAvailable uses it
+        self._settings_cache = None  # (file stamp, settings) as last read from/written to SETTINGS_FILE
+        self._playlist_tracks_cache = None  # (sldl command, tracks) from the last --print tracks run this download
+        self._pending_output = []  # Text queued by _queueOutput for the next flushOutput
+        self._pending_output_length = 0  # Characters in _pending_output
+        self._output_flush_scheduled = False
+        self._output_reset_pending = False  # Next flushOutput replaces the log instead of appending
+        self._pending_ui_updates = []  # (method name, args) queued by _queueUIUpdate for drainUIUpdates
+        self._ui_drain_posted = False
+        self._output_lock = threading.Lock()  # Guards the six fields above; they are set from worker threads
+        self._dir_panel = None  # Folder picker, built on the first Browse click and reused
+        self._csv_panel = None  # CSV file picker, built on the first Browse click and reused
+        self._pending_settings = None  # Latest settings snapshot waiting for _writePendingSettings
+        self._settings_save_scheduled = False
+        self._settings_lock = threading.Lock()  # Guards the two fields above
         
         if getattr(sys, 'frozen', False) and hasattr(sys, '_MEIPASS'):
             self.sldl_path = Path(sys._MEIPASS) / 'bin' / 'sldl'
@@ -99,12 +438,22 @@ class AppDelegate(NSObject):
             else:
                 self.sldl_path = 'sldl'
 
+        # Check for updates and read the settings file in the background while the UI is built
+        self.check_for_updates_async()
+        settings_future = BACKGROUND_EXECUTOR.submit(self._readSettingsFile)
+        # Verify sldl once up front so the first Start Download only has to stat the binary
+        self._sldl_launch_probe = BACKGROUND_EXECUTOR.submit(probe_sldl, str(self.sldl_path))
+
         self.setup_menu()
         self.build_ui()
+
+        # The settings read has normally finished by now; loadSettings reuses the cached result
+        concurrent.futures.wait([settings_future])
         self.load_settings()
-        
-        # Check for updates in background thread
-        self.check_for_updates_async()
+
+        # Show the window only once every control is built and positioned, so the
+        # initial layout and the source-dependent field changes land in one first draw
+        self.window.makeKeyAndOrderFront_(None)
         
         NSApp.activateIgnoringOtherApps_(True)
 
@@ -135,127 +484,20 @@ class AppDelegate(NSObject):
         """Setup application menu with Edit menu for copy/paste support and Extra Tools menu."""
         # Create main menu bar
         main_menu = NSMenu.alloc().init()
-        
-        # Create App menu
-        app_menu_item = NSMenuItem.alloc().init()
-        main_menu.addItem_(app_menu_item)
-        app_menu = NSMenu.alloc().init()
-        app_menu_item.setSubmenu_(app_menu)
-        
-        # Add Quit item to app menu
-        quit_item = NSMenuItem.alloc().initWithTitle_action_keyEquivalent_(
-            "Quit sldl-gui", "terminate:", "q"
-        )
-        app_menu.addItem_(quit_item)
-        
-        # Create Edit menu
-        edit_menu_item = NSMenuItem.alloc().initWithTitle_action_keyEquivalent_(
-            "Edit", None, ""
-        )
-        main_menu.addItem_(edit_menu_item)
-        edit_menu = NSMenu.alloc().initWithTitle_("Edit")
-        edit_menu_item.setSubmenu_(edit_menu)
-        
-        # Add standard Edit menu items
-        cut_item = NSMenuItem.alloc().initWithTitle_action_keyEquivalent_(
-            "Cut", "cut:", "x"
-        )
-        edit_menu.addItem_(cut_item)
-        
-        copy_item = NSMenuItem.alloc().initWithTitle_action_keyEquivalent_(
-            "Copy", "copy:", "c"
-        )
-        edit_menu.addItem_(copy_item)
-        
-        paste_item = NSMenuItem.alloc().initWithTitle_action_keyEquivalent_(
-            "Paste", "paste:", "v"
-        )
-        edit_menu.addItem_(paste_item)
-        
-        edit_menu.addItem_(NSMenuItem.separatorItem())
-        
-        select_all_item = NSMenuItem.alloc().initWithTitle_action_keyEquivalent_(
-            "Select All", "selectAll:", "a"
-        )
-        edit_menu.addItem_(select_all_item)
-        
-        # Create Extra Tools menu
-        extra_tools_menu_item = NSMenuItem.alloc().initWithTitle_action_keyEquivalent_(
-            "Extra Tools", None, ""
-        )
-        main_menu.addItem_(extra_tools_menu_item)
-        extra_tools_menu = NSMenu.alloc().initWithTitle_("Extra Tools")
-        extra_tools_menu_item.setSubmenu_(extra_tools_menu)
-        
-        # Add Output to CSV item
-        output_csv_item = NSMenuItem.alloc().initWithTitle_action_keyEquivalent_(
-            "Output to .csv", "outputToCSV:", ""
-        )
-        extra_tools_menu.addItem_(output_csv_item)
-        
-        # Add Import wishlist from SoulseekQT item
-        import_slsk_item = NSMenuItem.alloc().initWithTitle_action_keyEquivalent_(
-            "Import wishlist from SoulseekQT", "importWishlistFromSoulseekQT:", ""
-        )
-        extra_tools_menu.addItem_(import_slsk_item)
-        
-        # Create Bugs menu
-        bugs_menu_item = NSMenuItem.alloc().initWithTitle_action_keyEquivalent_(
-            "Bugs", None, ""
-        )
-        main_menu.addItem_(bugs_menu_item)
-        bugs_menu = NSMenu.alloc().initWithTitle_("Bugs")
-        bugs_menu_item.setSubmenu_(bugs_menu)
-        
-        # Add Known bugs item
-        known_bugs_item = NSMenuItem.alloc().initWithTitle_action_keyEquivalent_(
-            "Known bugs", "showKnownBugs:", ""
-        )
-        bugs_menu.addItem_(known_bugs_item)
-        
-        # Add Report bug item
-        report_bug_item = NSMenuItem.alloc().initWithTitle_action_keyEquivalent_(
-            "Report bug", "reportBug:", ""
-        )
-        bugs_menu.addItem_(report_bug_item)
-        
-        # Create Acknowledgements menu
-        acknowledgements_menu_item = NSMenuItem.alloc().initWithTitle_action_keyEquivalent_(
-            "Acknowledgements", None, ""
-        )
-        main_menu.addItem_(acknowledgements_menu_item)
-        acknowledgements_menu = NSMenu.alloc().initWithTitle_("Acknowledgements")
-        acknowledgements_menu_item.setSubmenu_(acknowledgements_menu)
-        
-        # Add Acknowledgements item
-        acknowledgements_item = NSMenuItem.alloc().initWithTitle_action_keyEquivalent_(
-            "Show Acknowledgements", "showAcknowledgements:", ""
-        )
-        acknowledgements_menu.addItem_(acknowledgements_item)
-        
-        # Add separator
-        acknowledgements_menu.addItem_(NSMenuItem.separatorItem())
-        
-        # Add clickable URL items
-        sldl_url_item = NSMenuItem.alloc().initWithTitle_action_keyEquivalent_(
-            "Visit sldl (slsk-batchdl) Repository", "openSldlUrl:", ""
-        )
-        acknowledgements_menu.addItem_(sldl_url_item)
-        
-        fiso64_url_item = NSMenuItem.alloc().initWithTitle_action_keyEquivalent_(
-            "Visit fiso64's GitHub Profile", "openFiso64Url:", ""
-        )
-        acknowledgements_menu.addItem_(fiso64_url_item)
-        
-        # Add separator
-        acknowledgements_menu.addItem_(NSMenuItem.separatorItem())
-        
-        # Add this project's repository link
-        project_url_item = NSMenuItem.alloc().initWithTitle_action_keyEquivalent_(
-            "Visit this project's repository", "openProjectUrl:", ""
-        )
-        acknowledgements_menu.addItem_(project_url_item)
-        
+
+        for menu_title, items in MAIN_MENU_LAYOUT:
+            menu_item = NSMenuItem.alloc().initWithTitle_action_keyEquivalent_(menu_title, None, "")
+            main_menu.addItem_(menu_item)
+            menu = NSMenu.alloc().initWithTitle_(menu_title)
+            menu_item.setSubmenu_(menu)
+
+            for item in items:
+                if item is None:
+                    menu.addItem_(NSMenuItem.separatorItem())
+                else:
+                    title, action, key = item
+                    menu.addItem_(NSMenuItem.alloc().initWithTitle_action_keyEquivalent_(title, action, key))
+
         # Set the main menu
         NSApp.setMainMenu_(main_menu)
 
@@ -275,7 +517,11 @@ class AppDelegate(NSObject):
         self.window.setTitle_("sldl-gui")
         self.window.center()
         self.window.setMinSize_(self.window.frame().size)
+        self.window.setDelegate_(self)  # For windowDidChangeOcclusionState_
         view = self.window.contentView()
+        # Content size is fixed until the window is shown; read it across the bridge once
+        view_size = view.frame().size
+        view_width, view_height = view_size.width, view_size.height
         
         # --- Constants for layout ---
         PADDING = 20
@@ -286,20 +532,19 @@ class AppDelegate(NSObject):
         FIELD_Y_SPACING = 40
         SECTION_SPACING = 60
         
+        # Font shared by the section headers
+        section_font = NSFont.systemFontOfSize_(13)
+
         # --- Top-Down Layout ---
-        y = view.frame().size.height - PADDING
+        y = view_height - PADDING
 
         # Source Selection and URL on same line
         y -= CONTROL_HEIGHT
-        self.source_label = NSTextField.labelWithString_("Source:")
-        self.source_label.setFrame_(NSMakeRect(PADDING, y, 60, CONTROL_HEIGHT))
-        self.source_label.setAutoresizingMask_(NSViewMinYMargin)
-        view.addSubview_(self.source_label)
+        self.source_label = self.__makeLabel(view, "Source:", NSMakeRect(PADDING, y, 60, CONTROL_HEIGHT))
         
         source_field_x = PADDING + 60
         self.source_popup = NSPopUpButton.alloc().initWithFrame_(NSMakeRect(source_field_x, y, 150, CONTROL_HEIGHT))
-        self.source_popup.addItemsWithTitles_(["YouTube Playlist", "Spotify Playlist", "Wishlist", "CSV File"])
-        self.source_popup.selectItemWithTitle_("YouTube Playlist")
+        self.source_popup.addItemsWithTitles_(["YouTube Playlist", "Spotify Playlist", "Wishlist", "CSV File"])  # First item is selected by default
         self.source_popup.setTarget_(self)
         self.source_popup.setAction_("sourceChanged:")
         self.source_popup.setAutoresizingMask_(NSViewMinYMargin)
@@ -307,82 +552,21 @@ class AppDelegate(NSObject):
 
         # URL field on same line as source
         url_label_x = source_field_x + 160
-        self.url_label = NSTextField.labelWithString_("URL:")
-        self.url_label.setFrame_(NSMakeRect(url_label_x, y, 40, CONTROL_HEIGHT))
-        self.url_label.setAutoresizingMask_(NSViewMinYMargin)
+        self.url_label = self.__makeLabel(view, "URL:", NSMakeRect(url_label_x, y, 40, CONTROL_HEIGHT))
         self.url_label.setHidden_(True)  # Hide by default, will be shown only when needed
-        view.addSubview_(self.url_label)
         
         url_field_x = url_label_x + 40
-        url_field_width = view.frame().size.width - url_field_x - PADDING
-        self.playlist_field = NSTextField.alloc().initWithFrame_(NSMakeRect(url_field_x, y, url_field_width, CONTROL_HEIGHT))
-        self.playlist_field.setBezelStyle_(NSTextFieldRoundedBezel)
-        self.playlist_field.setEditable_(True)
-        self.playlist_field.setSelectable_(True)
-        self.playlist_field.cell().setScrollable_(True)
-        self.playlist_field.cell().setWraps_(False)
-        self.playlist_field.setAutoresizingMask_(NSViewWidthSizable | NSViewMinYMargin)
-        self.playlist_field.setPlaceholderString_("https://www.youtube.com/playlist?list=...")
-        view.addSubview_(self.playlist_field)
+        url_field_width = view_width - url_field_x - PADDING
+        self.playlist_field = self.__makeTextField(view, NSMakeRect(url_field_x, y, url_field_width, CONTROL_HEIGHT), MASK_WIDTH_TOP, placeholder="https://www.youtube.com/playlist?list=...", scrollable=True)
 
         # Spotify Playlist URL (initially hidden)
-        self.spotify_label = NSTextField.labelWithString_("Spotify Playlist URL:")
-        self.spotify_label.setFrame_(NSMakeRect(url_label_x, y, 40, CONTROL_HEIGHT))
-        self.spotify_label.setAutoresizingMask_(NSViewMinYMargin)
-        self.spotify_label.setHidden_(True)
-        view.addSubview_(self.spotify_label)
-        
-        self.spotify_field = NSTextField.alloc().initWithFrame_(NSMakeRect(url_field_x, y, url_field_width, CONTROL_HEIGHT))
-        self.spotify_field.setBezelStyle_(NSTextFieldRoundedBezel)
-        self.spotify_field.setEditable_(True)
-        self.spotify_field.setSelectable_(True)
-        self.spotify_field.cell().setScrollable_(True)
-        self.spotify_field.cell().setWraps_(False)
-        self.spotify_field.setAutoresizingMask_(NSViewWidthSizable | NSViewMinYMargin)
+        self.spotify_field = self.__makeTextField(view, NSMakeRect(url_field_x, y, url_field_width, CONTROL_HEIGHT), MASK_WIDTH_TOP, placeholder="https://open.spotify.com/playlist/...", scrollable=True)
         self.spotify_field.setHidden_(True)
-        self.spotify_field.setPlaceholderString_("https://open.spotify.com/playlist/...")
-        view.addSubview_(self.spotify_field)
-
-        # Wishlist File (initially hidden)
-        self.wishlist_label = NSTextField.labelWithString_("Wishlist File:")
-        self.wishlist_label.setFrame_(NSMakeRect(url_label_x, y, 40, CONTROL_HEIGHT))
-        self.wishlist_label.setAutoresizingMask_(NSViewMinYMargin)
-        self.wishlist_label.setHidden_(True)
-        view.addSubview_(self.wishlist_label)
-        
-        self.wishlist_field = NSTextField.alloc().initWithFrame_(NSMakeRect(url_field_x, y, url_field_width, CONTROL_HEIGHT))
-        self.wishlist_field.setBezelStyle_(NSTextFieldRoundedBezel)
-        self.wishlist_field.setEditable_(True)
-        self.wishlist_field.setSelectable_(True)
-        self.wishlist_field.cell().setScrollable_(True)
-        self.wishlist_field.cell().setWraps_(False)
-        self.wishlist_field.setAutoresizingMask_(NSViewWidthSizable | NSViewMinYMargin)
-        self.wishlist_field.setHidden_(True)
-        self.wishlist_field.setPlaceholderString_("~/sldl/wishlist.txt")
-        view.addSubview_(self.wishlist_field)
-        
-        wishlist_browse_button_x = url_field_x + url_field_width + 10
-        self.wishlist_browse_button = NSButton.alloc().initWithFrame_(NSMakeRect(wishlist_browse_button_x, y, 80, BUTTON_HEIGHT))
-        self.wishlist_browse_button.setTitle_("Browse")
-        self.wishlist_browse_button.setBezelStyle_(NSBezelStyleRounded)
-        self.wishlist_browse_button.setTarget_(self)
-        self.wishlist_browse_button.setAction_("browseWishlistFile:")
-        self.wishlist_browse_button.setAutoresizingMask_(NSViewMinXMargin | NSViewMinYMargin)
-        self.wishlist_browse_button.setHidden_(True)
-        view.addSubview_(self.wishlist_browse_button)
 
         # CSV File (initially hidden)
         csv_field_width = url_field_width - 90  # Make room for browse button
-        self.csv_field = NSTextField.alloc().initWithFrame_(NSMakeRect(url_field_x, y, csv_field_width, CONTROL_HEIGHT))
-        self.csv_field.setBezelStyle_(NSTextFieldRoundedBezel)
-        self.csv_field.setEditable_(True)
-        self.csv_field.setSelectable_(True)
-        self.csv_field.cell().setScrollable_(True)
-        self.csv_field.cell().setWraps_(False)
-        self.csv_field.setAutoresizingMask_(NSViewWidthSizable | NSViewMinYMargin)
+        self.csv_field = self.__makeTextField(view, NSMakeRect(url_field_x, y, csv_field_width, CONTROL_HEIGHT), MASK_WIDTH_TOP, placeholder="Select a CSV file with artist and title columns", scrollable=True)
         self.csv_field.setHidden_(True)
-        self.csv_field.setPlaceholderString_("Select a CSV file with artist and title columns")
-        view.addSubview_(self.csv_field)
         
         csv_browse_button_x = url_field_x + csv_field_width + 10
         self.csv_browse_button = NSButton.alloc().initWithFrame_(NSMakeRect(csv_browse_button_x, y, 80, BUTTON_HEIGHT))
@@ -390,35 +574,19 @@ class AppDelegate(NSObject):
         self.csv_browse_button.setBezelStyle_(NSBezelStyleRounded)
         self.csv_browse_button.setTarget_(self)
         self.csv_browse_button.setAction_("browseCSVFile:")
-        self.csv_browse_button.setAutoresizingMask_(NSViewMinXMargin | NSViewMinYMargin)
+        self.csv_browse_button.setAutoresizingMask_(MASK_RIGHT_TOP)
         self.csv_browse_button.setHidden_(True)
         view.addSubview_(self.csv_browse_button)
 
         # Soulseek Username, Password, and Remember Password on same line
         y -= FIELD_Y_SPACING
-        self.user_label = NSTextField.labelWithString_("Username:")
-        self.user_label.setFrame_(NSMakeRect(PADDING, y, 80, CONTROL_HEIGHT))
-        self.user_label.setAutoresizingMask_(NSViewMinYMargin)
-        view.addSubview_(self.user_label)
-        self.user_field = NSTextField.alloc().initWithFrame_(NSMakeRect(PADDING + 80, y, 150, CONTROL_HEIGHT))
-        self.user_field.setBezelStyle_(NSTextFieldRoundedBezel)
-        self.user_field.setEditable_(True)
-        self.user_field.setSelectable_(True)
-        self.user_field.setAutoresizingMask_(NSViewMinYMargin)
-        view.addSubview_(self.user_field)
+        self.user_label = self.__makeLabel(view, "Username:", NSMakeRect(PADDING, y, 80, CONTROL_HEIGHT))
+        self.user_field = self.__makeTextField(view, NSMakeRect(PADDING + 80, y, 150, CONTROL_HEIGHT), NSViewMinYMargin)
 
         # Password field on same line
         pass_label_x = PADDING + 240
-        self.pass_label = NSTextField.labelWithString_("Password:")
-        self.pass_label.setFrame_(NSMakeRect(pass_label_x, y, 70, CONTROL_HEIGHT))
-        self.pass_label.setAutoresizingMask_(NSViewMinYMargin)
-        view.addSubview_(self.pass_label)
-        self.pass_field = NSSecureTextField.alloc().initWithFrame_(NSMakeRect(pass_label_x + 70, y, 150, CONTROL_HEIGHT))
-        self.pass_field.setBezelStyle_(NSTextFieldRoundedBezel)
-        self.pass_field.setEditable_(True)
-        self.pass_field.setSelectable_(True)
-        self.pass_field.setAutoresizingMask_(NSViewMinYMargin)
-        view.addSubview_(self.pass_field)
+        self.pass_label = self.__makeLabel(view, "Password:", NSMakeRect(pass_label_x, y, 70, CONTROL_HEIGHT))
+        self.pass_field = self.__makeTextField(view, NSMakeRect(pass_label_x + 70, y, 150, CONTROL_HEIGHT), NSViewMinYMargin, secure=True)
         
         # Remember Password checkbox on same line
         checkbox_x = pass_label_x + 230
@@ -431,47 +599,25 @@ class AppDelegate(NSObject):
 
         # Listen Port
         y -= FIELD_Y_SPACING
-        self.port_label = NSTextField.labelWithString_("Listen Port (optional):")
-        self.port_label.setFrame_(NSMakeRect(PADDING, y, 140, CONTROL_HEIGHT))
-        self.port_label.setAutoresizingMask_(NSViewMinYMargin)
-        view.addSubview_(self.port_label)
-        self.port_field = NSTextField.alloc().initWithFrame_(NSMakeRect(PADDING + 150, y, 100, CONTROL_HEIGHT))
-        self.port_field.setBezelStyle_(NSTextFieldRoundedBezel)
-        self.port_field.setPlaceholderString_("49998")
-        self.port_field.setEditable_(True)
-        self.port_field.setSelectable_(True)
-        self.port_field.setAutoresizingMask_(NSViewMinYMargin)
-        view.addSubview_(self.port_field)
+        self.port_label = self.__makeLabel(view, "Listen Port (optional):", NSMakeRect(PADDING, y, 140, CONTROL_HEIGHT))
+        self.port_field = self.__makeTextField(view, NSMakeRect(PADDING + 150, y, 100, CONTROL_HEIGHT), NSViewMinYMargin, placeholder="49998")
 
         # Concurrent Downloads
         y -= FIELD_Y_SPACING
-        self.concurrent_label = NSTextField.labelWithString_("Concurrent Downloads:")
-        self.concurrent_label.setFrame_(NSMakeRect(PADDING, y, 140, CONTROL_HEIGHT))
-        self.concurrent_label.setAutoresizingMask_(NSViewMinYMargin)
-        view.addSubview_(self.concurrent_label)
+        self.concurrent_label = self.__makeLabel(view, "Concurrent Downloads:", NSMakeRect(PADDING, y, 140, CONTROL_HEIGHT))
         self.concurrent_popup = NSPopUpButton.alloc().initWithFrame_(NSMakeRect(PADDING + 150, y, 100, CONTROL_HEIGHT))
         self.concurrent_popup.addItemsWithTitles_(["1", "2", "3", "4"])
-        self.concurrent_popup.selectItemWithTitle_("2")  # Default to 2
+        self.concurrent_popup.selectItemAtIndex_(1)  # Default to 2
         self.concurrent_popup.setAutoresizingMask_(NSViewMinYMargin)
         view.addSubview_(self.concurrent_popup)
 
         # Download Path
         y -= FIELD_Y_SPACING
-        self.path_label = NSTextField.labelWithString_("Download Path:")
-        self.path_label.setFrame_(NSMakeRect(PADDING, y, 140, CONTROL_HEIGHT))
-        self.path_label.setAutoresizingMask_(NSViewMinYMargin)
-        view.addSubview_(self.path_label)
+        self.path_label = self.__makeLabel(view, "Download Path:", NSMakeRect(PADDING, y, 140, CONTROL_HEIGHT))
         
         browse_button_width = 80
-        path_field_width = view.frame().size.width - (PADDING + 150) - browse_button_width - PADDING - 10
-        self.path_field = NSTextField.alloc().initWithFrame_(NSMakeRect(PADDING + 150, y, path_field_width, CONTROL_HEIGHT))
-        self.path_field.setBezelStyle_(NSTextFieldRoundedBezel)
-        self.path_field.setEditable_(True)
-        self.path_field.setSelectable_(True)
-        self.path_field.cell().setScrollable_(True)
-        self.path_field.cell().setWraps_(False)
-        self.path_field.setAutoresizingMask_(NSViewWidthSizable | NSViewMinYMargin)
-        view.addSubview_(self.path_field)
+        path_field_width = view_width - (PADDING + 150) - browse_button_width - PADDING - 10
+        self.path_field = self.__makeTextField(view, NSMakeRect(PADDING + 150, y, path_field_width, CONTROL_HEIGHT), MASK_WIDTH_TOP, scrollable=True)
         
         browse_button_x = (PADDING + 150) + path_field_width + 10
         self.browse_button = NSButton.alloc().initWithFrame_(NSMakeRect(browse_button_x, y, browse_button_width, BUTTON_HEIGHT))
@@ -479,7 +625,7 @@ class AppDelegate(NSObject):
         self.browse_button.setBezelStyle_(NSBezelStyleRounded)
         self.browse_button.setTarget_(self)
         self.browse_button.setAction_("browseDirectory:")
-        self.browse_button.setAutoresizingMask_(NSViewMinXMargin | NSViewMinYMargin)
+        self.browse_button.setAutoresizingMask_(MASK_RIGHT_TOP)
         view.addSubview_(self.browse_button)
 
         # Search Cleaning option
@@ -493,11 +639,7 @@ class AppDelegate(NSObject):
 
         # --- Wishlist Management Section ---
         y -= SECTION_SPACING
-        wishlist_section_label = NSTextField.labelWithString_("Wishlist Management")
-        wishlist_section_label.setFrame_(NSMakeRect(PADDING, y, 200, CONTROL_HEIGHT))
-        wishlist_section_label.setFont_(objc.lookUpClass("NSFont").systemFontOfSize_(13))
-        wishlist_section_label.setAutoresizingMask_(NSViewMinYMargin)
-        view.addSubview_(wishlist_section_label)
+        self.__makeLabel(view, "Wishlist Management", NSMakeRect(PADDING, y, 200, CONTROL_HEIGHT), font=section_font)
 
         y -= FIELD_Y_SPACING
         # Wishlist Mode checkbox
@@ -550,116 +692,48 @@ class AppDelegate(NSObject):
 
         # --- Audio Format Section ---
         y -= SECTION_SPACING
-        format_section_label = NSTextField.labelWithString_("Audio Format & Quality Criteria")
-        format_section_label.setFrame_(NSMakeRect(PADDING, y, 300, CONTROL_HEIGHT))
-        format_section_label.setFont_(objc.lookUpClass("NSFont").systemFontOfSize_(13))
-        format_section_label.setAutoresizingMask_(NSViewMinYMargin)
-        view.addSubview_(format_section_label)
+        self.__makeLabel(view, "Audio Format & Quality Criteria", NSMakeRect(PADDING, y, 300, CONTROL_HEIGHT), font=section_font)
 
         y -= FIELD_Y_SPACING
-        preferred_header = NSTextField.labelWithString_("Preferred")
-        preferred_header.setFrame_(NSMakeRect(PADDING, y, 200, CONTROL_HEIGHT))
-        preferred_header.setFont_(objc.lookUpClass("NSFont").systemFontOfSize_(13))
-        preferred_header.setAutoresizingMask_(NSViewMinYMargin)
-        view.addSubview_(preferred_header)
-
-        strict_header = NSTextField.labelWithString_("Mandatory")
-        strict_header.setFrame_(NSMakeRect(350, y, 200, CONTROL_HEIGHT))
-        strict_header.setFont_(objc.lookUpClass("NSFont").systemFontOfSize_(13))
-        strict_header.setAutoresizingMask_(NSViewMinYMargin)
-        view.addSubview_(strict_header)
+        self.__makeLabel(view, "Preferred", NSMakeRect(PADDING, y, 200, CONTROL_HEIGHT), font=section_font)
+
+        self.__makeLabel(view, "Mandatory", NSMakeRect(350, y, 200, CONTROL_HEIGHT), font=section_font)
 
         y -= FIELD_Y_SPACING
-        pref_format_label = NSTextField.labelWithString_("Format:")
-        pref_format_label.setFrame_(NSMakeRect(PADDING, y, 60, CONTROL_HEIGHT))
-        pref_format_label.setAutoresizingMask_(NSViewMinYMargin)
-        view.addSubview_(pref_format_label)
+        self.__makeLabel(view, "Format:", NSMakeRect(PADDING, y, 60, CONTROL_HEIGHT))
         
         self.pref_format_popup = NSPopUpButton.alloc().initWithFrame_(NSMakeRect(80, y, 120, CONTROL_HEIGHT))
-        self.pref_format_popup.addItemsWithTitles_([
-            "Any", "mp3", "flac", "wav", "m4a", "aac", "ogg", "opus", 
-            "wma", "ape", "alac", "aiff", "wv", "shn", "tak", "tta"
-        ])
-        self.pref_format_popup.selectItemWithTitle_("Any")
+        self.pref_format_popup.addItemsWithTitles_(AUDIO_FORMATS)  # Starts on "Any"
         self.pref_format_popup.setAutoresizingMask_(NSViewMinYMargin)
         view.addSubview_(self.pref_format_popup)
 
-        strict_format_label = NSTextField.labelWithString_("Format:")
-        strict_format_label.setFrame_(NSMakeRect(350, y, 60, CONTROL_HEIGHT))
-        strict_format_label.setAutoresizingMask_(NSViewMinYMargin)
-        view.addSubview_(strict_format_label)
+        self.__makeLabel(view, "Format:", NSMakeRect(350, y, 60, CONTROL_HEIGHT))
         
         self.strict_format_popup = NSPopUpButton.alloc().initWithFrame_(NSMakeRect(410, y, 120, CONTROL_HEIGHT))
-        self.strict_format_popup.addItemsWithTitles_([
-            "Any", "mp3", "flac", "wav", "m4a", "aac", "ogg", "opus", 
-            "wma", "ape", "alac", "aiff", "wv", "shn", "tak", "tta"
-        ])
-        self.strict_format_popup.selectItemWithTitle_("Any")
+        self.strict_format_popup.addItemsWithTitles_(AUDIO_FORMATS)  # Starts on "Any"
         self.strict_format_popup.setAutoresizingMask_(NSViewMinYMargin)
         view.addSubview_(self.strict_format_popup)
 
         y -= FIELD_Y_SPACING
-        pref_min_bitrate_label = NSTextField.labelWithString_("Min Bitrate:")
-        pref_min_bitrate_label.setFrame_(NSMakeRect(PADDING, y, 80, CONTROL_HEIGHT))
-        pref_min_bitrate_label.setAutoresizingMask_(NSViewMinYMargin)
-        view.addSubview_(pref_min_bitrate_label)
+        self.__makeLabel(view, "Min Bitrate:", NSMakeRect(PADDING, y, 80, CONTROL_HEIGHT))
         
-        self.pref_min_bitrate_field = NSTextField.alloc().initWithFrame_(NSMakeRect(100, y, 70, CONTROL_HEIGHT))
-        self.pref_min_bitrate_field.setPlaceholderString_("200")
-        self.pref_min_bitrate_field.setBezelStyle_(NSTextFieldRoundedBezel)
-        self.pref_min_bitrate_field.setEditable_(True)
-        self.pref_min_bitrate_field.setSelectable_(True)
-        self.pref_min_bitrate_field.setAutoresizingMask_(NSViewMinYMargin)
-        view.addSubview_(self.pref_min_bitrate_field)
+        self.pref_min_bitrate_field = self.__makeTextField(view, NSMakeRect(100, y, 70, CONTROL_HEIGHT), NSViewMinYMargin, placeholder="200")
         
-        pref_kbps1 = NSTextField.labelWithString_("kbps")
-        pref_kbps1.setFrame_(NSMakeRect(175, y, 35, CONTROL_HEIGHT))
-        pref_kbps1.setAutoresizingMask_(NSViewMinYMargin)
-        view.addSubview_(pref_kbps1)
-
-        pref_max_bitrate_label = NSTextField.labelWithString_("Max:")
-        pref_max_bitrate_label.setFrame_(NSMakeRect(220, y, 35, CONTROL_HEIGHT))
-        pref_max_bitrate_label.setAutoresizingMask_(NSViewMinYMargin)
-        view.addSubview_(pref_max_bitrate_label)
+        self.__makeLabel(view, "kbps", NSMakeRect(175, y, 35, CONTROL_HEIGHT))
+
+        self.__makeLabel(view, "Max:", NSMakeRect(220, y, 35, CONTROL_HEIGHT))
         
-        self.pref_max_bitrate_field = NSTextField.alloc().initWithFrame_(NSMakeRect(255, y, 70, CONTROL_HEIGHT))
-        self.pref_max_bitrate_field.setPlaceholderString_("2500")
-        self.pref_max_bitrate_field.setBezelStyle_(NSTextFieldRoundedBezel)
-        self.pref_max_bitrate_field.setEditable_(True)
-        self.pref_max_bitrate_field.setSelectable_(True)
-        self.pref_max_bitrate_field.setAutoresizingMask_(NSViewMinYMargin)
-        view.addSubview_(self.pref_max_bitrate_field)
-
-        strict_min_bitrate_label = NSTextField.labelWithString_("Min Bitrate:")
-        strict_min_bitrate_label.setFrame_(NSMakeRect(350, y, 80, CONTROL_HEIGHT))
-        strict_min_bitrate_label.setAutoresizingMask_(NSViewMinYMargin)
-        view.addSubview_(strict_min_bitrate_label)
+        self.pref_max_bitrate_field = self.__makeTextField(view, NSMakeRect(255, y, 70, CONTROL_HEIGHT), NSViewMinYMargin, placeholder="2500")
+
+        self.__makeLabel(view, "Min Bitrate:", NSMakeRect(350, y, 80, CONTROL_HEIGHT))
         
-        self.strict_min_bitrate_field = NSTextField.alloc().initWithFrame_(NSMakeRect(430, y, 70, CONTROL_HEIGHT))
-        self.strict_min_bitrate_field.setPlaceholderString_("128")
-        self.strict_min_bitrate_field.setBezelStyle_(NSTextFieldRoundedBezel)
-        self.strict_min_bitrate_field.setEditable_(True)
-        self.strict_min_bitrate_field.setSelectable_(True)
-        self.strict_min_bitrate_field.setAutoresizingMask_(NSViewMinYMargin)
-        view.addSubview_(self.strict_min_bitrate_field)
+        self.strict_min_bitrate_field = self.__makeTextField(view, NSMakeRect(430, y, 70, CONTROL_HEIGHT), NSViewMinYMargin, placeholder="128")
         
-        strict_kbps1 = NSTextField.labelWithString_("kbps")
-        strict_kbps1.setFrame_(NSMakeRect(505, y, 35, CONTROL_HEIGHT))
-        strict_kbps1.setAutoresizingMask_(NSViewMinYMargin)
-        view.addSubview_(strict_kbps1)
-
-        strict_max_bitrate_label = NSTextField.labelWithString_("Max:")
-        strict_max_bitrate_label.setFrame_(NSMakeRect(550, y, 35, CONTROL_HEIGHT))
-        strict_max_bitrate_label.setAutoresizingMask_(NSViewMinYMargin)
-        view.addSubview_(strict_max_bitrate_label)
+        self.__makeLabel(view, "kbps", NSMakeRect(505, y, 35, CONTROL_HEIGHT))
+
+        self.__makeLabel(view, "Max:", NSMakeRect(550, y, 35, CONTROL_HEIGHT))
         
-        self.strict_max_bitrate_field = NSTextField.alloc().initWithFrame_(NSMakeRect(585, y, 70, CONTROL_HEIGHT))
-        self.strict_max_bitrate_field.setPlaceholderString_("320")
-        self.strict_max_bitrate_field.setBezelStyle_(NSTextFieldRoundedBezel)
-        self.strict_max_bitrate_field.setEditable_(True)
-        self.strict_max_bitrate_field.setSelectable_(True)
-        self.strict_max_bitrate_field.setAutoresizingMask_(NSViewMinYMargin)
-        view.addSubview_(self.strict_max_bitrate_field)
+        self.strict_max_bitrate_field = self.__makeTextField(view, NSMakeRect(585, y, 70, CONTROL_HEIGHT), NSViewMinYMargin, placeholder="320")
 
         top_section_bottom_y = y - PADDING
 
@@ -667,11 +741,8 @@ class AppDelegate(NSObject):
         y = PADDING
 
         # Status Label
-        self.status_label = NSTextField.labelWithString_("Waiting for download to start...")
-        status_label_width = view.frame().size.width - (PADDING * 2)
-        self.status_label.setFrame_(NSMakeRect(PADDING, y, status_label_width, CONTROL_HEIGHT))
-        self.status_label.setAutoresizingMask_(NSViewWidthSizable | NSViewMaxYMargin)
-        view.addSubview_(self.status_label)
+        status_label_width = view_width - (PADDING * 2)
+        self.status_label = self.__makeLabel(view, "Waiting for download to start...", NSMakeRect(PADDING, y, status_label_width, CONTROL_HEIGHT), MASK_WIDTH_BOTTOM)
         
         y += CONTROL_HEIGHT + 10
 
@@ -682,7 +753,7 @@ class AppDelegate(NSObject):
         self.start_button.setKeyEquivalent_("\r")
         self.start_button.setTarget_(self)
         self.start_button.setAction_("startDownload:")
-        self.start_button.setAutoresizingMask_(NSViewMaxXMargin | NSViewMaxYMargin)
+        self.start_button.setAutoresizingMask_(MASK_LEFT_BOTTOM)
         view.addSubview_(self.start_button)
 
         # Stop button (initially disabled)
@@ -693,7 +764,7 @@ class AppDelegate(NSObject):
         self.stop_button.setEnabled_(False)
         self.stop_button.setTarget_(self)
         self.stop_button.setAction_("stopDownload:")
-        self.stop_button.setAutoresizingMask_(NSViewMaxXMargin | NSViewMaxYMargin)
+        self.stop_button.setAutoresizingMask_(MASK_LEFT_BOTTOM)
         view.addSubview_(self.stop_button)
 
         help_button_x = stop_button_x + 150 + 10
@@ -702,17 +773,17 @@ class AppDelegate(NSObject):
         help_button.setBezelStyle_(NSBezelStyleRounded)
         help_button.setTarget_(self)
         help_button.setAction_("showGuides:")
-        help_button.setAutoresizingMask_(NSViewMaxXMargin | NSViewMaxYMargin)
+        help_button.setAutoresizingMask_(MASK_LEFT_BOTTOM)
         view.addSubview_(help_button)
 
         progress_x = help_button_x + 120 + 20
-        progress_width = view.frame().size.width - progress_x - PADDING
+        progress_width = view_width - progress_x - PADDING
         self.progress = NSProgressIndicator.alloc().initWithFrame_(NSMakeRect(progress_x, y + 4, progress_width, 20))
         self.progress.setIndeterminate_(False)
         self.progress.setMinValue_(0)
         self.progress.setMaxValue_(100)
         self.progress.setDoubleValue_(0)
-        self.progress.setAutoresizingMask_(NSViewWidthSizable | NSViewMaxYMargin)
+        self.progress.setAutoresizingMask_(MASK_WIDTH_BOTTOM)
         view.addSubview_(self.progress)
         
         bottom_section_top_y = y + START_BUTTON_HEIGHT
@@ -720,21 +791,23 @@ class AppDelegate(NSObject):
         # --- Middle Scroll View (fills the gap) ---
         scroll_y = bottom_section_top_y + PADDING
         scroll_height = top_section_bottom_y - scroll_y
-        scroll_width = view.frame().size.width - (PADDING * 2)
+        scroll_width = view_width - (PADDING * 2)
         
         scroll = NSScrollView.alloc().initWithFrame_(NSMakeRect(PADDING, scroll_y, scroll_width, scroll_height))
         scroll.setHasVerticalScroller_(True)
         scroll.setHasHorizontalScroller_(False)
         scroll.setAutohidesScrollers_(True)
-        scroll.setAutoresizingMask_(NSViewWidthSizable | NSViewHeightSizable)
+        scroll.setAutoresizingMask_(MASK_FILL)
         
         self.output_view = NSTextView.alloc().initWithFrame_(scroll.bounds())
         self.output_view.setEditable_(False)
         self.output_view.setSelectable_(True)
+        # Lay out only what is on screen; the log can grow to thousands of lines
+        self.output_view.layoutManager().setAllowsNonContiguousLayout_(True)
 
-        font = objc.lookUpClass("NSFont").fontWithName_size_("Monaco", 12.0)
+        font = NSFont.fontWithName_size_("Monaco", 12.0)
         if font is None:
-            font = objc.lookUpClass("NSFont").systemFontOfSize_(12.0)
+            font = NSFont.systemFontOfSize_(12.0)
 
         self.output_view.setBackgroundColor_(NSColor.textBackgroundColor())
         attributes = {
@@ -742,107 +815,83 @@ class AppDelegate(NSObject):
             NSForegroundColorAttributeName: NSColor.labelColor()
         }
         self.output_view.setTypingAttributes_(attributes)
+        # labelColor is a dynamic color, so these stay correct across appearance changes
+        self._output_attributes = attributes
         self.output_view.setFont_(font)
         
         scroll.setDocumentView_(self.output_view)
         view.addSubview_(scroll)
 
-        self.window.makeKeyAndOrderFront_(None)
+    def __makeLabel(self, view, text, frame, autoresizing_mask=NSViewMinYMargin, font=None):
+        """Create a static label, add it to view and return it."""
+        label = NSTextField.labelWithString_(text)
+        label.setFrame_(frame)
+        if font is not None:
+            label.setFont_(font)
+        label.setAutoresizingMask_(autoresizing_mask)
+        view.addSubview_(label)
+        return label
+
+    def __makeTextField(self, view, frame, autoresizing_mask, placeholder=None, scrollable=False, secure=False):
+        """Create an editable rounded-bezel text field, add it to view and return it."""
+        field_class = NSSecureTextField if secure else NSTextField
+        field = field_class.alloc().initWithFrame_(frame)
+        field.setBezelStyle_(NSTextFieldRoundedBezel)
+        field.setEditable_(True)
+        field.setSelectable_(True)
+        if scrollable:
+            # Single-line field that scrolls horizontally instead of wrapping
+            cell = field.cell()
+            cell.setScrollable_(True)
+            cell.setWraps_(False)
+        field.setAutoresizingMask_(autoresizing_mask)
+        if placeholder:
+            field.setPlaceholderString_(placeholder)
+        view.addSubview_(field)
+        return field
 
     def showGuides_(self, sender):
         """Open guides file in the user's default text editor."""
-        import os
-        import subprocess
-        
-        try:
-            # Get the script directory and guides file path
-            script_dir = os.path.dirname(os.path.abspath(__file__))
-            guides_path = os.path.join(script_dir, "guides.txt")
-            
-            # Always try to fetch the latest version from GitHub first
-            import urllib.request
-            import urllib.error
-            
-            guides_url = "https://raw.githubusercontent.com/felixhj/sldl-gui-macos/main/guides.txt"
-            
-            try:
-                # Create SSL context that doesn't verify certificates (for macOS compatibility)
-                ssl_context = ssl.create_default_context()
-                ssl_context.check_hostname = False
-                ssl_context.verify_mode = ssl.CERT_NONE
-                
-                # Fetch guides from GitHub
-                with urllib.request.urlopen(guides_url, context=ssl_context) as response:
-                    guides_text = response.read().decode('utf-8')
-                
-                # Save to local file (overwrite if exists)
-                with open(guides_path, 'w', encoding='utf-8') as f:
-                    f.write(guides_text)
-                
-                # Open the downloaded file
-                subprocess.run(["open", guides_path], check=True)
-                
-            except (urllib.error.URLError, Exception) as e:
-                # Show error if GitHub source fails
-                self.showAlert_message_("Error", f"Unable to load guides: {str(e)}\n\nPlease check your internet connection or visit the GitHub repository.")
-                    
-        except subprocess.CalledProcessError as e:
-            self.showAlert_message_("Error", f"Failed to open guides file: {str(e)}")
-        except Exception as e:
-            self.showAlert_message_("Error", f"Unexpected error: {str(e)}")
+        self.__openLatestRepoTextFile("guides.txt", "guides")
 
     def showKnownBugs_(self, sender):
         """Open bugs-to-fix.txt file in the user's default text editor."""
-        import os
-        import subprocess
-        
-        try:
-            # Get the script directory and bugs file path
+        self.__openLatestRepoTextFile("bugs-to-fix.txt", "bugs file")
+
+    def __openLatestRepoTextFile(self, filename, description):
+        """Fetch the latest copy of a text file from the GitHub repository and open it.
+
+        The download runs on BACKGROUND_EXECUTOR so a slow connection can't
+        freeze the menu; any error alert is shown back on the main thread.
+        """
+        def fetch_and_open():
+            # Save next to the script, overwriting any earlier copy
             script_dir = os.path.dirname(os.path.abspath(__file__))
-            bugs_path = os.path.join(script_dir, "bugs-to-fix.txt")
-            
-            # Always try to fetch the latest version from GitHub first
-            import urllib.request
-            import urllib.error
-            
-            bugs_url = "https://raw.githubusercontent.com/felixhj/sldl-gui-macos/main/bugs-to-fix.txt"
-            
+            local_path = os.path.join(script_dir, filename)
+            url = f"https://raw.githubusercontent.com/felixhj/sldl-gui-macos/main/{filename}"
             try:
-                # Create SSL context that doesn't verify certificates (for macOS compatibility)
-                ssl_context = ssl.create_default_context()
-                ssl_context.check_hostname = False
-                ssl_context.verify_mode = ssl.CERT_NONE
-                
-                # Fetch bugs from GitHub
-                with urllib.request.urlopen(bugs_url, context=ssl_context) as response:
-                    bugs_text = response.read().decode('utf-8')
-                
-                # Save to local file (overwrite if exists)
-                with open(bugs_path, 'w', encoding='utf-8') as f:
-                    f.write(bugs_text)
-                
-                # Open the downloaded file
-                subprocess.run(["open", bugs_path], check=True)
-                
-            except (urllib.error.URLError, Exception) as e:
-                # Show error if GitHub source fails
-                self.showAlert_message_("Error", f"Unable to load bugs file: {str(e)}\n\nPlease check your internet connection or visit the GitHub repository.")
-                    
-        except subprocess.CalledProcessError as e:
-            self.showAlert_message_("Error", f"Failed to open bugs file: {str(e)}")
-        except Exception as e:
-            self.showAlert_message_("Error", f"Unexpected error: {str(e)}")
+                # Read the whole body before touching the local copy, then save the
+                # bytes as served; they are already UTF-8, so no decode/encode round trip
+                with urllib.request.urlopen(url, timeout=NETWORK_TIMEOUT, context=SSL_CONTEXT) as response:
+                    content = response.read()
+                with open(local_path, 'wb') as f:
+                    f.write(content)
+                subprocess.run(["open", local_path], check=True)
+            except subprocess.CalledProcessError as e:
+                self._queueUIUpdate("showAlert_message_", "Error", f"Failed to open {description}: {str(e)}")
+            except Exception as e:
+                self._queueUIUpdate(
+                    "showAlert_message_", "Error",
+                    f"Unable to load {description}: {str(e)}\n\nPlease check your internet connection or visit the GitHub repository."
+                )
+
+        BACKGROUND_EXECUTOR.submit(fetch_and_open)
 
     def reportBug_(self, sender):
         """Open user's email client with pre-populated bug report fields."""
-        import subprocess
-        import platform
-        import datetime
-        
         try:
             # Get current date/time
-            now = datetime.datetime.now()
-            date_time_str = now.strftime("%Y-%m-%d %H:%M:%S")
+            date_time_str = time.strftime("%Y-%m-%d %H:%M:%S")
             
             # Get system information
             system_info = platform.system()
@@ -881,7 +930,6 @@ Cursor did all the rest, so a thank you to big ai, I guess?"""
 
     def openSldlUrl_(self, sender):
         """Open sldl (slsk-batchdl) repository in default browser."""
-        import subprocess
         try:
             subprocess.run(["open", "https://github.com/fiso64/slsk-batchdl"], check=True)
         except subprocess.CalledProcessError as e:
@@ -889,7 +937,6 @@ Cursor did all the rest, so a thank you to big ai, I guess?"""
 
     def openFiso64Url_(self, sender):
         """Open fiso64's GitHub profile in default browser."""
-        import subprocess
         try:
             subprocess.run(["open", "https://github.com/fiso64"], check=True)
         except subprocess.CalledProcessError as e:
@@ -897,7 +944,6 @@ Cursor did all the rest, so a thank you to big ai, I guess?"""
 
     def openProjectUrl_(self, sender):
         """Open this project's repository in default browser."""
-        import subprocess
         try:
             subprocess.run(["open", "https://github.com/felixhj/sldl-gui-macos"], check=True)
         except subprocess.CalledProcessError as e:
@@ -919,36 +965,24 @@ Cursor did all the rest, so a thank you to big ai, I guess?"""
             # Reposition field to eliminate gap
             self.playlist_field.setFrame_(NSMakeRect(direct_field_x, self.playlist_field.frame().origin.y, 
                                                     self.window.contentView().frame().size.width - direct_field_x - 20, 24))
-            self.spotify_label.setHidden_(True)
             self.spotify_field.setHidden_(True)
-            self.wishlist_label.setHidden_(True)
-            self.wishlist_field.setHidden_(True)
-            self.wishlist_browse_button.setHidden_(True)
             self.csv_field.setHidden_(True)
             self.csv_browse_button.setHidden_(True)
         elif selected_source == "Spotify Playlist":
             # Show Spotify fields, hide others
             self.url_label.setHidden_(True)
             self.playlist_field.setHidden_(True)
-            self.spotify_label.setHidden_(True)  # Hide Spotify label since placeholder serves purpose
             self.spotify_field.setHidden_(False)
             # Reposition field to eliminate gap
             self.spotify_field.setFrame_(NSMakeRect(direct_field_x, self.spotify_field.frame().origin.y, 
                                                    self.window.contentView().frame().size.width - direct_field_x - 20, 24))
-            self.wishlist_label.setHidden_(True)
-            self.wishlist_field.setHidden_(True)
-            self.wishlist_browse_button.setHidden_(True)
             self.csv_field.setHidden_(True)
             self.csv_browse_button.setHidden_(True)
         elif selected_source == "CSV File":
             # Show CSV fields, hide others
             self.url_label.setHidden_(True)
             self.playlist_field.setHidden_(True)
-            self.spotify_label.setHidden_(True)
             self.spotify_field.setHidden_(True)
-            self.wishlist_label.setHidden_(True)
-            self.wishlist_field.setHidden_(True)
-            self.wishlist_browse_button.setHidden_(True)
             self.csv_field.setHidden_(False)
             self.csv_browse_button.setHidden_(False)
             # Reposition CSV field to eliminate gap
@@ -961,35 +995,133 @@ Cursor did all the rest, so a thank you to big ai, I guess?"""
             # Hide all input fields for wishlist since we use internal wishlist
             self.url_label.setHidden_(True)
             self.playlist_field.setHidden_(True)
-            self.spotify_label.setHidden_(True)
             self.spotify_field.setHidden_(True)
-            self.wishlist_label.setHidden_(True)
-            self.wishlist_field.setHidden_(True)
-            self.wishlist_browse_button.setHidden_(True)
             self.csv_field.setHidden_(True)
             self.csv_browse_button.setHidden_(True)
 
     def appendOutput_(self, text):
-        """Safely append text to the output view on the main thread."""
-        if not isinstance(text, NSString):
-            text = NSString.stringWithString_(str(text))
-        
-        # Use the theme-aware typing attributes set on the text view
-        attributes = self.output_view.typingAttributes()
-        attr_string = objc.lookUpClass("NSAttributedString").alloc().initWithString_attributes_(text, attributes)
+        """Queue text for the output view; bursts are appended together by flushOutput."""
+        self._queueOutput(str(text))
+
+    def _queueOutput(self, text):
+        """Queue text for the output view from any thread, waking the main thread once per flush.
+
+        Text is queued immediately, in call order, so lines from the download
+        thread and messages from elsewhere always appear in the order they
+        were produced.
+        """
+        with self._output_lock:
+            self._pending_output.append(text)
+            self._pending_output_length += len(text)
+            if self._pending_output_length > OUTPUT_MAX_LENGTH:
+                # Output is piling up while the window is hidden; keep only the tail the view
+                # would show after trimming, and have the next flush replace the whole log
+                pending = "".join(self._pending_output)
+                cut = pending.find("\n", len(pending) - OUTPUT_TRIM_LENGTH)
+                pending = pending[cut + 1:] if cut != -1 else pending[-OUTPUT_TRIM_LENGTH:]
+                self._pending_output[:] = [pending]
+                self._pending_output_length = len(pending)
+                self._output_reset_pending = True
+            if self._output_flush_scheduled:
+                return
+            self._output_flush_scheduled = True
+        self.performSelectorOnMainThread_withObject_waitUntilDone_("scheduleOutputFlush", None, False)
+
+    def scheduleOutputFlush(self):
+        """Run flushOutput after OUTPUT_FLUSH_INTERVAL so a burst of output lands in one edit."""
+        # Common modes, like performSelectorOnMainThread, so output keeps flowing behind modal alerts
+        self.performSelector_withObject_afterDelay_inModes_(
+            "flushOutput", None, OUTPUT_FLUSH_INTERVAL, [NSRunLoopCommonModes]
+        )
+
+    def flushOutput(self):
+        """Append all queued output to the output view in one edit and scroll to the end."""
+        if not self.window.occlusionState() & NSWindowOcclusionStateVisible:
+            # Nobody can see the log (app hidden, window closed or covered), so skip the
+            # layout work; the text stays queued (capped by _queueOutput) until
+            # windowDidChangeOcclusionState_
+            return
+        with self._output_lock:
+            self._output_flush_scheduled = False
+            reset = self._output_reset_pending
+            self._output_reset_pending = False
+            text = "".join(self._pending_output)
+            self._pending_output.clear()
+            self._pending_output_length = 0
+        if not text and not reset:
+            return
+
+        # Use the theme-aware attributes the text view was set up with
+        attr_string = NSAttributedString.alloc().initWithString_attributes_(text, self._output_attributes)
         
         storage = self.output_view.textStorage()
-        storage.appendAttributedString_(attr_string)
-        
-        # Scroll to bottom
-        length = len(self.output_view.string())
+        storage.beginEditing()
+        if reset:
+            # First output of a new download: clear the old log and add the text in the same edit
+            storage.replaceCharactersInRange_withAttributedString_((0, storage.length()), attr_string)
+        else:
+            storage.appendAttributedString_(attr_string)
+        if storage.length() > OUTPUT_MAX_LENGTH:
+            # Drop the oldest lines, cutting on a line boundary, to keep the log bounded
+            log_text = storage.string()
+            cut = log_text.find("\n", len(log_text) - OUTPUT_TRIM_LENGTH)
+            if cut != -1:
+                # NSString ranges count UTF-16 units, not Python code points
+                cut_length = len(log_text[:cut + 1].encode('utf-16-le')) // 2
+                storage.deleteCharactersInRange_((0, cut_length))
+        storage.endEditing()
+        
+        # Scroll to bottom; the storage knows its length without copying the text into Python
+        length = storage.length()
         if length > 0:
             self.output_view.scrollRangeToVisible_((length, 0))
 
+    def windowDidChangeOcclusionState_(self, notification):
+        """Show output that was held back while the window was not visible."""
+        if not self.window.occlusionState() & NSWindowOcclusionStateVisible:
+            return
+        with self._output_lock:
+            flush_scheduled = self._output_flush_scheduled
+        if flush_scheduled:
+            self.flushOutput()
+
+    @objc.python_method
+    def _queueUIUpdate(self, method_name, *args):
+        """Queue a call to one of the UI update methods from any thread, in order.
+
+        The main thread is woken once per batch rather than once per call, and
+        a progress update that directly follows another replaces it, so a burst
+        of finished tracks becomes a single progress bar and label redraw.
+        """
+        with self._output_lock:
+            pending = self._pending_ui_updates
+            if pending and method_name == "updateProgressAndStatus_" and pending[-1][0] == method_name:
+                pending[-1] = (method_name, args)
+            else:
+                pending.append((method_name, args))
+            if self._ui_drain_posted:
+                return
+            self._ui_drain_posted = True
+        self.performSelectorOnMainThread_withObject_waitUntilDone_("drainUIUpdates", None, False)
+
+    def drainUIUpdates(self):
+        """Run every UI update queued by _queueUIUpdate since the last drain."""
+        with self._output_lock:
+            updates = self._pending_ui_updates
+            self._pending_ui_updates = []
+            self._ui_drain_posted = False
+        for method_name, args in updates:
+            try:
+                getattr(self, method_name)(*args)
+            except Exception as e:
+                print(f"Error applying UI update: {e}")
+
     def updateProgressAndStatus_(self, status_info):
         """Safely update progress bar and status label on the main thread."""
         current_step, message = status_info
-        self.progress.setDoubleValue_(float(current_step))
+        current_step = float(current_step)
+        if current_step != self.progress.doubleValue():
+            self.progress.setDoubleValue_(current_step)
 
         # Just show the message directly without step information
         self.status_label.setStringValue_(message)
@@ -1011,9 +1143,7 @@ Cursor did all the rest, so a thank you to big ai, I guess?"""
 
     def updateStatusText_(self, text):
         """Safely update the status label on the main thread."""
-        if not isinstance(text, NSString):
-            text = NSString.stringWithString_(str(text))
-        self.status_label.setStringValue_(text)
+        self.status_label.setStringValue_(str(text))
 
     def enableStartButton_(self, enabled):
         """Safely enable/disable start button on the main thread."""
@@ -1025,13 +1155,16 @@ Cursor did all the rest, so a thank you to big ai, I guess?"""
 
     def browseDirectory_(self, sender):
         """Handle browse button click with New Folder option."""
-        # Use the most reliable approach for directory selection
-        panel = NSOpenPanel.openPanel()
-        panel.setCanChooseFiles_(False)
-        panel.setCanChooseDirectories_(True)
-        panel.setAllowsMultipleSelection_(False)
-        panel.setTitle_("Select Download Directory")
-        panel.setCanCreateDirectories_(True)
+        # Configure the panel once; later clicks reopen it in the last folder visited
+        if self._dir_panel is None:
+            panel = NSOpenPanel.openPanel()
+            panel.setCanChooseFiles_(False)
+            panel.setCanChooseDirectories_(True)
+            panel.setAllowsMultipleSelection_(False)
+            panel.setTitle_("Select Download Directory")
+            panel.setCanCreateDirectories_(True)
+            self._dir_panel = panel
+        panel = self._dir_panel
         
         # Run modally - this blocks until user makes a choice
         result = panel.runModal()
@@ -1043,28 +1176,17 @@ Cursor did all the rest, so a thank you to big ai, I guess?"""
                 folder_path = urls[0].path()
                 self.path_field.setStringValue_(folder_path)
 
-    def browseWishlistFile_(self, sender):
-        """Open file browser for wishlist file."""
-        panel = NSOpenPanel.openPanel()
-        panel.setCanChooseFiles_(True)
-        panel.setCanChooseDirectories_(False)
-        panel.setAllowsMultipleSelection_(False)
-        panel.setTitle_("Select Wishlist File")
-        panel.setAllowedFileTypes_(["txt"])
-        
-        if panel.runModal() == NSAlertFirstButtonReturn:
-            url = panel.URL()
-            if url:
-                self.wishlist_field.setStringValue_(url.path())
-
     def browseCSVFile_(self, sender):
         """Open file browser for CSV file."""
-        panel = NSOpenPanel.openPanel()
-        panel.setCanChooseFiles_(True)
-        panel.setCanChooseDirectories_(False)
-        panel.setAllowsMultipleSelection_(False)
-        panel.setTitle_("Select CSV File")
-        panel.setAllowedFileTypes_(["csv"])
+        if self._csv_panel is None:
+            panel = NSOpenPanel.openPanel()
+            panel.setCanChooseFiles_(True)
+            panel.setCanChooseDirectories_(False)
+            panel.setAllowsMultipleSelection_(False)
+            panel.setTitle_("Select CSV File")
+            panel.setAllowedFileTypes_(["csv"])
+            self._csv_panel = panel
+        panel = self._csv_panel
         
         if panel.runModal() == NSModalResponseOK:
             url = panel.URL()
@@ -1073,29 +1195,19 @@ Cursor did all the rest, so a thank you to big ai, I guess?"""
 
     def startDownload_(self, sender):
         """Handle start download button click."""
-        # Validate inputs
-        selected_source = self.source_popup.titleOfSelectedItem()
+        # Read the form once; the download thread works from this snapshot
+        params = self._snapshotFormState()
+        selected_source = params['selected_source']
         
+        # Validate inputs
         if selected_source == "YouTube Playlist":
-            playlist_url = self.playlist_field.stringValue().strip()
-            if not playlist_url:
-                self.showAlert_message_("Error", "Please enter a YouTube playlist URL.")
-                return
-            # Basic YouTube URL validation
-            if not any(pattern in playlist_url.lower() for pattern in ['youtube.com', 'youtu.be']):
-                self.showAlert_message_("Error", "Please enter a valid YouTube playlist URL.")
+            if not self._validatePlaylistUrl(selected_source, params['playlist_url']):
                 return
         elif selected_source == "Spotify Playlist":
-            spotify_url = self.spotify_field.stringValue().strip()
-            if not spotify_url:
-                self.showAlert_message_("Error", "Please enter a Spotify playlist URL.")
-                return
-            # Basic Spotify URL validation
-            if not any(pattern in spotify_url.lower() for pattern in ['spotify.com', 'open.spotify.com']):
-                self.showAlert_message_("Error", "Please enter a valid Spotify playlist URL.")
+            if not self._validatePlaylistUrl(selected_source, params['spotify_url']):
                 return
         elif selected_source == "CSV File":
-            csv_path = self.csv_field.stringValue().strip()
+            csv_path = params['csv_file_path']
             if not csv_path:
                 self.showAlert_message_("Error", "Please select a CSV file.")
                 return
@@ -1105,7 +1217,6 @@ Cursor did all the rest, so a thank you to big ai, I guess?"""
                 return
             # Validate CSV format
             try:
-                import csv
                 with open(csv_path, 'r', newline='', encoding='utf-8') as csvfile:
                     reader = csv.DictReader(csvfile)
                     if not reader.fieldnames:
@@ -1127,8 +1238,8 @@ Cursor did all the rest, so a thank you to big ai, I guess?"""
                 self.showAlert_message_("Error", "Your wishlist is empty. Please add some tracks to your wishlist first.")
                 return
         
-        username = self.user_field.stringValue().strip()
-        password = self.pass_field.stringValue().strip()
+        username = params['username']
+        password = params['password']
         
         if not username:
             self.showAlert_message_("Error", "Please enter your Soulseek username.")
@@ -1138,9 +1249,7 @@ Cursor did all the rest, so a thank you to big ai, I guess?"""
             return
 
         # Check if sldl is available
-        try:
-            subprocess.run([str(self.sldl_path), '--version'], capture_output=True, check=True)
-        except (subprocess.CalledProcessError, FileNotFoundError):
+        if not self._sldlAvailable():
             self.showAlert_message_("Error", "sldl command not found. Please install slsk-batchdl first.")
             return
 
@@ -1149,15 +1258,22 @@ Cursor did all the rest, so a thank you to big ai, I guess?"""
         self.stop_button.setEnabled_(True)
         self.download_running = True
         self.user_stopped = False
+        self.stop_event.clear()
+        self.download_params = params
         
         # Set download target directory
-        path_str = self.path_field.stringValue().strip()
+        path_str = params['download_path']
         if path_str:
             self.download_target_dir = Path(path_str).expanduser()
         else:
             self.download_target_dir = Path.cwd()  # Use current working directory if no path specified
 
-        self.output_view.setString_("")
+        self._playlist_tracks_cache = None  # Playlists can change between runs; fetch afresh
+        with self._output_lock:
+            self._pending_output.clear()  # Drop anything still queued from the previous run
+            self._pending_output_length = 0
+            # The old log is cleared by the flush that shows the "Executing:" line
+            self._output_reset_pending = True
         self.total_steps = 0
         
         # Start indeterminate progress immediately
@@ -1169,47 +1285,118 @@ Cursor did all the rest, so a thank you to big ai, I guess?"""
         thread = threading.Thread(target=self.downloadThread, daemon=True)
         thread.start()
 
+    def _validatePlaylistUrl(self, selected_source, url):
+        """Check a YouTube/Spotify playlist URL, showing an alert and returning False if it is unusable."""
+        service = selected_source.rsplit(' ', 1)[0]
+        if not url:
+            self.showAlert_message_("Error", f"Please enter a {service} playlist URL.")
+            return False
+        if not PLAYLIST_URL_PATTERNS[selected_source].search(url):
+            self.showAlert_message_("Error", f"Please enter a valid {service} playlist URL.")
+            return False
+        return True
+
+    def _snapshotFormState(self):
+        """Read every download-related control once and return the stripped values."""
+        return {
+            'selected_source': self.source_popup.titleOfSelectedItem(),
+            'playlist_url': self.playlist_field.stringValue().strip(),
+            'spotify_url': self.spotify_field.stringValue().strip(),
+            'csv_file_path': self.csv_field.stringValue().strip(),
+            'username': self.user_field.stringValue().strip(),
+            'password': self.pass_field.stringValue().strip(),
+            'download_path': self.path_field.stringValue().strip(),
+            'listen_port': self.port_field.stringValue().strip(),
+            'concurrent_downloads': self.concurrent_popup.titleOfSelectedItem(),
+            'pref_format': self.pref_format_popup.titleOfSelectedItem(),
+            'strict_format': self.strict_format_popup.titleOfSelectedItem(),
+            'pref_min_bitrate': self.pref_min_bitrate_field.stringValue().strip(),
+            'pref_max_bitrate': self.pref_max_bitrate_field.stringValue().strip(),
+            'strict_min_bitrate': self.strict_min_bitrate_field.stringValue().strip(),
+            'strict_max_bitrate': self.strict_max_bitrate_field.stringValue().strip(),
+            'wishlist_mode': bool(self.wishlist_mode_checkbox.state()),
+            'clean_search': bool(self.clean_search_checkbox.state()),
+        }
+
+    def _sldlAvailable(self):
+        """Return True if sldl runs, only re-running `sldl --version` when the binary changes.
+
+        Main thread only; this is the one place the launch probe's result is picked up.
+        """
+        launch_probe, self._sldl_launch_probe = self._sldl_launch_probe, None
+        if launch_probe is not None and not launch_probe.cancel():
+            # The launch probe has started (or finished): wait for it rather than run sldl twice
+            self._sldl_verified_stamp = launch_probe.result()
+
+        sldl_path = str(self.sldl_path)
+        resolved = shutil.which(sldl_path) or sldl_path
+        try:
+            stamp = (resolved, os.stat(resolved).st_mtime)
+        except OSError:
+            self._sldl_verified_stamp = None
+            return False
+
+        if stamp != self._sldl_verified_stamp:
+            self._sldl_verified_stamp = probe_sldl(resolved)
+            if self._sldl_verified_stamp != stamp:
+                return False
+
+        # Launch sldl by absolute path from now on so the child execs it
+        # directly instead of trying every $PATH entry in turn
+        self.sldl_path = resolved
+        return True
+
     def stopDownload_(self, sender):
         """Handle stop download button click."""
         if self.current_process and self.download_running:
             self.user_stopped = True  # Mark that the user initiated the stop
+            self.stop_event.set()
             
             # Mark remaining tracks as failed in session logger
             if self.session_logger and self.session_logger.session_started:
                 self.session_logger.mark_remaining_tracks_failed(7)  # Session stopped by user
-                self.performSelectorOnMainThread_withObject_waitUntilDone_(
-                    "appendOutput:", "📝 Marked remaining tracks as failed (session stopped)\n", False
-                )
+                self._queueOutput("📝 Marked remaining tracks as failed (session stopped)\n")
             
+            process = self.current_process
+            # Terminate sldl together with any children it spawned; it runs
+            # in its own session, so its pid is also the process group id
             try:
-                # Terminate the process
-                self.current_process.terminate()
-                
-                # Wait a bit for graceful termination
-                try:
-                    self.current_process.wait(timeout=5)
-                except subprocess.TimeoutExpired:
-                    # Force kill if it doesn't terminate gracefully
-                    self.current_process.kill()
-                    self.current_process.wait()
-                
+                os.killpg(process.pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass  # Already exited
             except Exception as e:
-                self.performSelectorOnMainThread_withObject_waitUntilDone_(
-                    "appendOutput:", f"❌ Error stopping download: {str(e)}\n", False
-                )
-            finally:
-                # UI updates are now handled in the downloadThread's finally block
-                self.download_running = False
-                self.stop_button.setEnabled_(False)
-                # Kick off cleanup of any leftover .incomplete files in the download directory
+                self._queueOutput(f"❌ Error stopping download: {str(e)}\n")
+
+            # UI updates are now handled in the downloadThread's finally block
+            self.download_running = False
+            self.stop_button.setEnabled_(False)
+
+            def _reap():
+                # Waiting for sldl to exit can take seconds, so do it off the main thread
                 try:
-                    self._cleanupIncompleteFilesAsync()
+                    try:
+                        process.wait(timeout=5)
+                    except subprocess.TimeoutExpired:
+                        # Force kill if it doesn't terminate gracefully
+                        try:
+                            os.killpg(process.pid, signal.SIGKILL)
+                        except ProcessLookupError:
+                            pass
+                        process.wait()
                 except Exception as e:
-                    # Best-effort cleanup; do not interrupt UI flow
-                    print(f"Error scheduling incomplete files cleanup: {e}")
+                    self._queueOutput(f"❌ Error stopping download: {str(e)}\n")
+                finally:
+                    # Kick off cleanup of any leftover .incomplete files once sldl is gone
+                    try:
+                        self._cleanupIncompleteFilesAsync()
+                    except Exception as e:
+                        # Best-effort cleanup; do not interrupt UI flow
+                        print(f"Error scheduling incomplete files cleanup: {e}")
+
+            threading.Thread(target=_reap, name="sldl-stop", daemon=True).start()
 
     def _cleanupIncompleteFilesAsync(self):
-        """Start a background thread to recursively delete '*.incomplete' files in the download directory."""
+        """Recursively delete '*.incomplete' files in the download directory on BACKGROUND_EXECUTOR."""
         try:
             base_dir = self.download_target_dir if getattr(self, 'download_target_dir', None) else Path.cwd()
 
@@ -1224,57 +1411,52 @@ Cursor did all the rest, so a thank you to big ai, I guess?"""
                             print(f"Error deleting incomplete file {file_path}: {inner_e}")
 
                     if removed_count > 0:
-                        self.performSelectorOnMainThread_withObject_waitUntilDone_(
-                            "appendOutput:", f"🧹 Removed {removed_count} incomplete files\n", False
-                        )
+                        self._queueOutput(f"🧹 Removed {removed_count} incomplete files\n")
                     else:
-                        self.performSelectorOnMainThread_withObject_waitUntilDone_(
-                            "appendOutput:", "🧹 No incomplete files to remove\n", False
-                        )
+                        self._queueOutput("🧹 No incomplete files to remove\n")
                 except Exception as worker_e:
                     print(f"Error during incomplete files cleanup: {worker_e}")
 
-            thread = threading.Thread(target=_worker, daemon=True)
-            thread.start()
+            BACKGROUND_EXECUTOR.submit(_worker)
         except Exception as e:
-            print(f"Error launching cleanup thread: {e}")
+            print(f"Error scheduling incomplete files cleanup: {e}")
 
     def downloadThread(self):
         """Run the download process in a background thread."""
+        params = self.download_params
+        selected_source = params['selected_source']
+        path = params['download_path']
         try:
-            selected_source = self.source_popup.titleOfSelectedItem()
-            username = self.user_field.stringValue().strip()
-            password = self.pass_field.stringValue().strip()
-            path = self.path_field.stringValue().strip()
+            username = params['username']
+            password = params['password']
             
             # Generate timestamp for folder naming
-            timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+            timestamp = time.strftime("%Y%m%d_%H%M%S")
+            self.sldl_output_dir = Path(path) if path else Path.cwd()
             
             if selected_source == "YouTube Playlist":
-                input_source = self.playlist_field.stringValue().strip()
+                input_source = params['playlist_url']
                 # Build base command for YouTube
                 cmd = [str(self.sldl_path), input_source, '--user', username, '--pass', password]
                 if path:
                     cmd.extend(['--path', path])
             elif selected_source == "Spotify Playlist":
-                input_source = self.spotify_field.stringValue().strip()
+                input_source = params['spotify_url']
                 # Build base command for Spotify
                 cmd = [str(self.sldl_path), input_source, '--user', username, '--pass', password]
                 if path:
                     cmd.extend(['--path', path])
             elif selected_source == "CSV File":
                 # Use CSV file directly with csv input type
-                csv_path = self.csv_field.stringValue().strip()
+                csv_path = params['csv_file_path']
                 if not csv_path:
-                    self.performSelectorOnMainThread_withObject_waitUntilDone_(
-                        "appendOutput:", "❌ No CSV file specified.\n", False
-                    )
+                    self._queueOutput("❌ No CSV file specified.\n")
                     return
                 
                 # Pass CSV file to sldl, optionally via a sanitized temporary copy
                 input_source = csv_path
                 try:
-                    if self.clean_search_checkbox.state():
+                    if params['clean_search']:
                         sanitized_csv = self.__createSanitizedCopyOfCSV(csv_path)
                         if sanitized_csv:
                             input_source = sanitized_csv
@@ -1290,13 +1472,12 @@ Cursor did all the rest, so a thank you to big ai, I guess?"""
                     # If no path specified, create in current directory
                     csv_folder = Path.cwd() / f"csv_{timestamp}"
                     cmd.extend(['--path', str(csv_folder)])
+                self.sldl_output_dir = csv_folder
             else:  # Wishlist
                 # Create temporary CSV file from wishlist
-                temp_csv_file = self.__createCSVFileFromWishlist()
+                temp_csv_file = self.__createCSVFileFromWishlist(params['clean_search'])
                 if not temp_csv_file:
-                    self.performSelectorOnMainThread_withObject_waitUntilDone_(
-                        "appendOutput:", "❌ Failed to create CSV file from wishlist.\n", False
-                    )
+                    self._queueOutput("❌ Failed to create CSV file from wishlist.\n")
                     return
                 
                 # Pass CSV file to sldl
@@ -1311,42 +1492,27 @@ Cursor did all the rest, so a thank you to big ai, I guess?"""
                     # If no path specified, create in current directory
                     wishlist_folder = Path.cwd() / f"wishlist_{timestamp}"
                     cmd.extend(['--path', str(wishlist_folder)])
-
-            port = self.port_field.stringValue().strip()
-            if port and port.isdigit():
-                cmd.extend(['--listen-port', port])
+                self.sldl_output_dir = wishlist_folder
 
             # Add concurrent downloads parameter
-            concurrent_downloads = self.concurrent_popup.titleOfSelectedItem()
+            concurrent_downloads = params['concurrent_downloads']
             if concurrent_downloads:
                 cmd.extend(['--concurrent-downloads', concurrent_downloads])
 
-            # Add format/quality parameters
-            # Preferred parameters
-            pref_format = self.pref_format_popup.titleOfSelectedItem()
+            # Add format parameters (preferred and strict)
+            pref_format = params['pref_format']
             if pref_format and pref_format != "Any":
                 cmd.extend(['--pref-format', pref_format])
 
-            pref_min_bitrate = self.pref_min_bitrate_field.stringValue().strip()
-            if pref_min_bitrate and pref_min_bitrate.isdigit():
-                cmd.extend(['--pref-min-bitrate', pref_min_bitrate])
-
-            pref_max_bitrate = self.pref_max_bitrate_field.stringValue().strip()
-            if pref_max_bitrate and pref_max_bitrate.isdigit():
-                cmd.extend(['--pref-max-bitrate', pref_max_bitrate])
-
-            # Strict parameters
-            strict_format = self.strict_format_popup.titleOfSelectedItem()
+            strict_format = params['strict_format']
             if strict_format and strict_format != "Any":
                 cmd.extend(['--format', strict_format])
 
-            strict_min_bitrate = self.strict_min_bitrate_field.stringValue().strip()
-            if strict_min_bitrate and strict_min_bitrate.isdigit():
-                cmd.extend(['--min-bitrate', strict_min_bitrate])
-
-            strict_max_bitrate = self.strict_max_bitrate_field.stringValue().strip()
-            if strict_max_bitrate and strict_max_bitrate.isdigit():
-                cmd.extend(['--max-bitrate', strict_max_bitrate])
+            # Add listen port and bitrate parameters
+            for key, flag in NUMERIC_SLDL_OPTIONS:
+                value = params[key]
+                if value and value.isdigit():
+                    cmd.extend([flag, value])
 
             # Initialize session logger based on source type
             tracks_to_download = []
@@ -1358,9 +1524,8 @@ Cursor did all the rest, so a thank you to big ai, I guess?"""
                 pass
             elif selected_source == "CSV File":
                 # For CSV, get tracks from the CSV file
-                csv_path = self.csv_field.stringValue().strip()
+                csv_path = params['csv_file_path']
                 if csv_path:
-                    import csv
                     with open(csv_path, 'r', newline='', encoding='utf-8') as csvfile:
                         reader = csv.DictReader(csvfile)
                         for row in reader:
@@ -1385,17 +1550,13 @@ Cursor did all the rest, so a thank you to big ai, I guess?"""
                 self.session_logger = SessionLogger(str(download_dir))
                 source_type = selected_source.lower().replace(' ', '_')
                 if self.session_logger.start_session(tracks_to_download, source_type):
-                    self.performSelectorOnMainThread_withObject_waitUntilDone_(
-                        "appendOutput:", f"📝 Session logging initialized with {len(tracks_to_download)} tracks\n", False
-                    )
+                    self._queueOutput(f"📝 Session logging initialized with {len(tracks_to_download)} tracks\n")
                 else:
-                    self.performSelectorOnMainThread_withObject_waitUntilDone_(
-                        "appendOutput:", "⚠️ Failed to initialize session logging\n", False
-                    )
+                    self._queueOutput("⚠️ Failed to initialize session logging\n")
             
             # For YouTube and Spotify playlists, get tracks and initialize session logger
             if selected_source in ["YouTube Playlist", "Spotify Playlist"]:
-                tracks_to_download = self.__get_playlist_tracks()
+                tracks_to_download = self.__get_playlist_tracks(params)
                 if tracks_to_download:
                     # Determine download directory for session logger
                     if path:
@@ -1407,28 +1568,26 @@ Cursor did all the rest, so a thank you to big ai, I guess?"""
                     self.session_logger = SessionLogger(str(download_dir))
                     source_type = selected_source.lower().replace(' ', '_')
                     if self.session_logger.start_session(tracks_to_download, source_type):
-                        self.performSelectorOnMainThread_withObject_waitUntilDone_(
-                            "appendOutput:", f"📝 Session logging initialized with {len(tracks_to_download)} tracks\n", False
-                        )
+                        self._queueOutput(f"📝 Session logging initialized with {len(tracks_to_download)} tracks\n")
                     else:
-                        self.performSelectorOnMainThread_withObject_waitUntilDone_(
-                            "appendOutput:", "⚠️ Failed to initialize session logging\n", False
-                        )
+                        self._queueOutput("⚠️ Failed to initialize session logging\n")
             
             # Show the command being executed
-            cmd_str = " ".join(cmd).replace(password, "***")  # Hide password
-            self.performSelectorOnMainThread_withObject_waitUntilDone_(
-                "appendOutput:", f"Executing: {cmd_str}\n\n", False
-            )
+            cmd_str = shlex.join(redact_command(cmd))  # Hide password, quote paths/URLs with spaces
+            self._queueOutput(f"Executing: {cmd_str}\n\n")
 
             # Run the process
+            # stdout is read through a buffered text wrapper, which pulls large
+            # chunks from the pipe and splits lines in C. The encoding is pinned
+            # because an app launched from Finder may have no UTF-8 locale, and
+            # a stray byte in a track name must not end the read loop.
             process = subprocess.Popen(
                 cmd,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.STDOUT,
-                text=True,
-                bufsize=1,
-                universal_newlines=True
+                encoding='utf-8',
+                errors='replace',
+                start_new_session=True  # Own process group so stopDownload_ can signal sldl's children too
             )
             
             # Store process reference for stopping
@@ -1445,15 +1604,14 @@ Cursor did all the rest, so a thank you to big ai, I guess?"""
                     initial_total_tracks = len(wishlist_items)
                     if initial_total_tracks > 0:
                         # Set initial progress for wishlist
-                        self.performSelectorOnMainThread_withObject_waitUntilDone_("switchToDeterminateProgress:", float(initial_total_tracks), False)
-                        self.performSelectorOnMainThread_withObject_waitUntilDone_("updateStatusText:", f"Processing {initial_total_tracks} wishlist items...", False)
+                        self._queueUIUpdate("switchToDeterminateProgress_", float(initial_total_tracks))
+                        self._queueUIUpdate("updateStatusText_", f"Processing {initial_total_tracks} wishlist items...")
                 except:
                     pass  # Fall back to dynamic detection
             elif selected_source == "CSV File":
                 # For CSV file, we can estimate total tracks from CSV items
                 try:
-                    csv_path = self.csv_field.stringValue().strip()
-                    import csv
+                    csv_path = params['csv_file_path']
                     csv_items = []
                     with open(csv_path, 'r', newline='', encoding='utf-8') as csvfile:
                         reader = csv.DictReader(csvfile)
@@ -1465,8 +1623,8 @@ Cursor did all the rest, so a thank you to big ai, I guess?"""
                     initial_total_tracks = len(csv_items)
                     if initial_total_tracks > 0:
                         # Set initial progress for CSV file
-                        self.performSelectorOnMainThread_withObject_waitUntilDone_("switchToDeterminateProgress:", float(initial_total_tracks), False)
-                        self.performSelectorOnMainThread_withObject_waitUntilDone_("updateStatusText:", f"Processing {initial_total_tracks} CSV items...", False)
+                        self._queueUIUpdate("switchToDeterminateProgress_", float(initial_total_tracks))
+                        self._queueUIUpdate("updateStatusText_", f"Processing {initial_total_tracks} CSV items...")
                 except:
                     pass  # Fall back to dynamic detection
 
@@ -1475,9 +1633,11 @@ Cursor did all the rest, so a thank you to big ai, I guess?"""
             failed_count = 0
             searching_count = 0
             
+            # Bind the check once; Event.is_set is cheaper than re-reading instance state per line
+            stop_requested = self.stop_event.is_set
             for line in process.stdout:
                 # Check if download was stopped
-                if not self.download_running:
+                if stop_requested():
                     break
                     
                 # Filter out verbose logs that aren't useful to the user
@@ -1488,47 +1648,52 @@ Cursor did all the rest, so a thank you to big ai, I guess?"""
                     pass
                 else:
                     # Update output on main thread for important messages
-                    self.performSelectorOnMainThread_withObject_waitUntilDone_(
-                        "appendOutput:", line, False
-                    )
+                    self._queueOutput(line)
                 
                 # --- Final progress logic based on user feedback ---
                 
                 # Update status based on various log messages
                 if "Loading YouTube playlist" in line or "Loading Spotify playlist" in line:
-                    self.performSelectorOnMainThread_withObject_waitUntilDone_("updateStatusText:", "Loading playlist...", False)
+                    self._queueUIUpdate("updateStatusText_", "Loading playlist...")
                 elif line.startswith("Login"):
-                    self.performSelectorOnMainThread_withObject_waitUntilDone_("updateStatusText:", "Logging in...", False)
+                    self._queueUIUpdate("updateStatusText_", "Logging in...")
                 elif selected_source == "Wishlist" and "Loading" in line:
                     # For wishlist, show loading status when processing the list
-                    self.performSelectorOnMainThread_withObject_waitUntilDone_("updateStatusText:", "Loading wishlist...", False)
+                    self._queueUIUpdate("updateStatusText_", "Loading wishlist...")
                 elif selected_source == "CSV File" and "Processing" in line:
                     # For CSV file, show processing status
-                    self.performSelectorOnMainThread_withObject_waitUntilDone_("updateStatusText:", "Processing CSV items...", False)
+                    self._queueUIUpdate("updateStatusText_", "Processing CSV items...")
 
                 # Get total tracks and set the max progress bar value
                 # Handle both playlist and wishlist formats
-                total_match = re.search(r'Downloading (\d+) tracks:', line)
+                # Substring tests are much cheaper than a regex search and rule out almost every line
+                total_match = TOTAL_TRACKS_RE.search(line) if "tracks:" in line else None
                 if total_match:
                     total_tracks = int(total_match.group(1))
                     if total_tracks > 0:
                         max_steps = float(total_tracks)
-                        self.performSelectorOnMainThread_withObject_waitUntilDone_("switchToDeterminateProgress:", max_steps, False)
+                        self._queueUIUpdate("switchToDeterminateProgress_", max_steps)
                     continue
                 
                 # For wishlist, if we haven't found total tracks yet, try to estimate from wishlist items
                 if selected_source == "Wishlist" and total_tracks == 0:
                     # Try to get total tracks from wishlist processing messages
-                    wishlist_total_match = re.search(r'Processing (\d+) items', line)
+                    wishlist_total_match = WISHLIST_ITEMS_RE.search(line) if " items" in line else None
                     if wishlist_total_match:
                         total_tracks = int(wishlist_total_match.group(1))
                         if total_tracks > 0:
                             max_steps = float(total_tracks)
-                            self.performSelectorOnMainThread_withObject_waitUntilDone_("switchToDeterminateProgress:", max_steps, False)
+                            self._queueUIUpdate("switchToDeterminateProgress_", max_steps)
                         continue
 
                 # --- Track successful downloads for progress ---
-                if line.startswith("Searching:"):
+                # Per-track lines look like "Searching: ...", "Succeeded: ..." or
+                # "All downloads failed: ..."; split off the label once and compare it
+                label, colon, _ = line.partition(':')
+                if not colon:
+                    label = None
+
+                if label == "Searching":
                     searching_count += 1
                     # Don't update progress bar during searching phase
                     continue
@@ -1537,62 +1702,60 @@ Cursor did all the rest, so a thank you to big ai, I guess?"""
                     if total_tracks > 0:
                         current_step = float(searching_count + 1)
                         status_message = f"Searching item {searching_count + 1}/{total_tracks}"
-                        self.performSelectorOnMainThread_withObject_waitUntilDone_("updateProgressAndStatus:", (current_step, status_message), False)
+                        self._queueUIUpdate("updateProgressAndStatus_", (current_step, status_message))
                     searching_count += 1
                     continue
                 
-                elif line.startswith("Succeeded:"):
+                elif label == "Succeeded":
                     succeeded_count += 1
                     
                     # Update progress bar and status with successful downloads
                     if total_tracks > 0:
                         current_step = float(succeeded_count)
                         status_message = f"{succeeded_count}/{total_tracks} downloaded"
-                        self.performSelectorOnMainThread_withObject_waitUntilDone_("updateProgressAndStatus:", (current_step, status_message), False)
+                        self._queueUIUpdate("updateProgressAndStatus_", (current_step, status_message))
                     continue
 
-                elif line.startswith("All downloads failed:"):
+                elif label == "All downloads failed":
                     failed_count += 1
                     # Don't update progress bar for failed downloads, just count them
                     continue
                 
                 # Get final completion summary from the log
-                completed_match = re.search(r'Completed: (.*)', line)
+                completed_match = COMPLETED_RE.search(line) if "Completed: " in line else None
                 if completed_match:
                     summary = completed_match.group(1).strip()
-                    self.performSelectorOnMainThread_withObject_waitUntilDone_("updateStatusText:", f"Finished: {summary}", False)
+                    self._queueUIUpdate("updateStatusText_", f"Finished: {summary}")
                     continue
 
             # Wait for process to complete (only if not stopped)
-            if self.download_running:
+            if not stop_requested():
                 return_code = process.wait()
             else:
                 return_code = -1  # Indicate stopped by user
             
             # Reset the progress indicator state
-            self.performSelectorOnMainThread_withObject_waitUntilDone_("resetProgressIndicator", None, False)
+            self._queueUIUpdate("resetProgressIndicator")
 
             # The progress bar's final state is now accurate. No need to force it.
             
             if return_code == -1 or self.user_stopped:
                 # Download was stopped by user
-                self.performSelectorOnMainThread_withObject_waitUntilDone_("appendOutput:", "\n🛑 User stopped download.\n", False)
-                self.performSelectorOnMainThread_withObject_waitUntilDone_("updateStatusText:", "Download stopped", False)
+                self._queueOutput("\n🛑 User stopped download.\n")
+                self._queueUIUpdate("updateStatusText_", "Download stopped")
             elif return_code == 0:
                 if failed_count == 0 and total_tracks > 0:
-                    self.performSelectorOnMainThread_withObject_waitUntilDone_("appendOutput:", "\n✅ Download completed successfully!\n", False)
+                    self._queueOutput("\n✅ Download completed successfully!\n")
                 elif total_tracks > 0:
-                    self.performSelectorOnMainThread_withObject_waitUntilDone_("appendOutput:", f"\nℹ️ Download finished: {succeeded_count} succeeded, {failed_count} failed.\n", False)
+                    self._queueOutput(f"\nℹ️ Download finished: {succeeded_count} succeeded, {failed_count} failed.\n")
                 # Handle cases where no tracks were found
             else:
-                self.performSelectorOnMainThread_withObject_waitUntilDone_("appendOutput:", f"\n❌ Download failed with code {return_code}\n", False)
-                self.performSelectorOnMainThread_withObject_waitUntilDone_("updateStatusText:", "Download failed", False)
+                self._queueOutput(f"\n❌ Download failed with code {return_code}\n")
+                self._queueUIUpdate("updateStatusText_", "Download failed")
 
         except Exception as e:
-            self.performSelectorOnMainThread_withObject_waitUntilDone_(
-                "appendOutput:", f"\n❌ Error: {str(e)}\n", False
-            )
-            self.performSelectorOnMainThread_withObject_waitUntilDone_("updateStatusText:", "An error occurred", False)
+            self._queueOutput(f"\n❌ Error: {str(e)}\n")
+            self._queueUIUpdate("updateStatusText_", "An error occurred")
         
         finally:
             # Reset process reference and UI state
@@ -1602,7 +1765,6 @@ Cursor did all the rest, so a thank you to big ai, I guess?"""
             # Clean up temporary wishlist file if it exists
             if 'temp_file_to_cleanup' in locals() and temp_file_to_cleanup:
                 try:
-                    import os
                     os.unlink(temp_file_to_cleanup)
                 except Exception as e:
                     print(f"Error cleaning up temp file: {e}")
@@ -1618,17 +1780,13 @@ Cursor did all the rest, so a thank you to big ai, I guess?"""
 
                     # Attempt to find and process the most recent sldl index file
                     processed_log_path = None
-                    index_files = list(download_dir.rglob("_index.csv"))
-                    if index_files:
-                        index_file = max(index_files, key=lambda f: f.stat().st_mtime)
-
+                    index_file = find_latest_index_file(download_dir, self.sldl_output_dir)
+                    if index_file:
                         # Convert sldl's _index.csv into a human-readable log.csv in the same folder
                         processor = SLDLCSVProcessor()
                         if processor.process_csv_file(str(index_file)):
                             processed_log_path = index_file.parent / 'log.csv'
-                            self.performSelectorOnMainThread_withObject_waitUntilDone_(
-                                "appendOutput:", "📝 Processed sldl index file into log.csv\n", False
-                            )
+                            self._queueOutput("📝 Processed sldl index file into log.csv\n")
 
                             # Delete the initial session log as it's superseded by processed log.csv
                             try:
@@ -1636,21 +1794,16 @@ Cursor did all the rest, so a thank you to big ai, I guess?"""
                                     session_log_path = Path(self.session_logger.get_log_path())
                                     if session_log_path.exists():
                                         session_log_path.unlink()
-                                        self.performSelectorOnMainThread_withObject_waitUntilDone_(
-                                            "appendOutput:", "🧹 Removed initial session log (replaced by processed log.csv)\n", False
-                                        )
+                                        self._queueOutput("🧹 Removed initial session log (replaced by processed log.csv)\n")
                             except Exception as e:
                                 print(f"Error deleting initial session log: {e}")
 
                     # Wishlist updates: prefer processed log.csv if available; otherwise fallback to initial session log
-                    if self.wishlist_mode_checkbox.state():
+                    if params['wishlist_mode']:
                         if processed_log_path and processed_log_path.exists():
-                            self.__processFailedDownloadsToWishlist(str(processed_log_path))
-                            self.__removeSuccessfulDownloadsFromWishlist(str(processed_log_path))
+                            self.__syncWishlistWithLog(str(processed_log_path))
                         elif self.session_logger.log_exists():
-                            log_path = self.session_logger.get_log_path()
-                            self.__processFailedDownloadsToWishlist(log_path)
-                            self.__removeSuccessfulDownloadsFromWishlist(log_path)
+                            self.__syncWishlistWithLog(self.session_logger.get_log_path())
 
                 except Exception as e:
                     print(f"Error finalizing logs: {e}")
@@ -1659,27 +1812,17 @@ Cursor did all the rest, so a thank you to big ai, I guess?"""
                     self.session_logger = None
             
             # Re-enable the start button and disable stop button
-            self.performSelectorOnMainThread_withObject_waitUntilDone_(
-                "enableStartButton:", True, False
-            )
-            self.performSelectorOnMainThread_withObject_waitUntilDone_(
-                "enableStopButton:", False, False
-            )
+            self._queueUIUpdate("enableStartButton_", True)
+            self._queueUIUpdate("enableStopButton_", False)
             
             # Save settings
-            self.performSelectorOnMainThread_withObject_waitUntilDone_(
-                "saveSettings", None, False
-            )
+            self._queueUIUpdate("saveSettings")
 
             # Handle stopped download logic (manual index augmentation if needed)
             if self.user_stopped:
                 # Only attempt manual augmentation for playlist sources where we can retrieve tracks
-                try:
-                    selected_source = self.source_popup.titleOfSelectedItem()
-                except Exception:
-                    selected_source = None
                 if selected_source in ["YouTube Playlist", "Spotify Playlist"]:
-                    self.generate_manual_index_file()
+                    self.generate_manual_index_file(params)
 
     def showAlert_message_(self, title, message):
         """Show an alert dialog."""
@@ -1693,8 +1836,7 @@ Cursor did all the rest, so a thank you to big ai, I guess?"""
         """Load saved settings from file."""
         if SETTINGS_FILE.exists():
             try:
-                with open(SETTINGS_FILE, 'r') as f:
-                    data = json.load(f)
+                data = self._readSettingsFile()
                 
                 # Load source selection
                 selected_source = data.get('selected_source', 'YouTube Playlist')
@@ -1753,6 +1895,16 @@ Cursor did all the rest, so a thank you to big ai, I guess?"""
             except Exception:
                 pass
 
+    def _readSettingsFile(self):
+        """Return the parsed settings file, reusing the cached copy while the file is unchanged."""
+        stamp = _file_stamp(SETTINGS_FILE)
+        if self._settings_cache and self._settings_cache[0] == stamp:
+            return self._settings_cache[1]
+        with open(SETTINGS_FILE, 'r') as f:
+            data = json.load(f)
+        self._settings_cache = (stamp, data)
+        return data
+
     def load_settings(self):
         """Public method to load settings."""
         self.loadSettings()
@@ -1784,99 +1936,58 @@ Cursor did all the rest, so a thank you to big ai, I guess?"""
         # Only save password if remember password is checked
         if remember_password:
             data['password'] = self.pass_field.stringValue()
-        try:
-            with open(SETTINGS_FILE, 'w') as f:
-                json.dump(data, f, indent=2)
-        except Exception:
-            pass
-
-    def save_settings(self):
-        """Public method to save settings."""
-        self.saveSettings()
 
-    def run_csv_processor(self):
-        """Find the latest _index.csv and process it."""
-        self.performSelectorOnMainThread_withObject_waitUntilDone_(
-            "updateStatusText:", "Processing CSV output...", False
-        )
-
-        try:
-            download_path_str = self.path_field.stringValue().strip()
-            if not download_path_str:
-                download_path = Path.cwd()
-            else:
-                download_path = Path(download_path_str)
-
-            if not download_path.is_dir():
-                print(f"CSV processor: Download directory '{download_path}' not found.")
-                return
+        # Nothing changed since the last load/save; skip the disk write
+        if self._settings_cache and data == self._settings_cache[1]:
+            return
 
-            # Find the most recent sldl index file
-            index_files = list(download_path.rglob("_index.csv"))
-            if not index_files:
-                self.performSelectorOnMainThread_withObject_waitUntilDone_(
-                    "updateStatusText:", "CSV to process not found", False
-                )
+        # Write on a worker thread; saves made while one is pending just replace its snapshot
+        with self._settings_lock:
+            self._pending_settings = data
+            if self._settings_save_scheduled:
                 return
-            
-            # Use the most recent one
-            index_file = max(index_files, key=lambda f: f.stat().st_mtime)
-
-            processor = SLDLCSVProcessor()
-            success = processor.process_csv_file(str(index_file))
-
-            if success:
-                # Process wishlist if mode is enabled
-                if self.wishlist_mode_checkbox.state():
-                    log_path = index_file.parent / 'log.csv'
-                    if log_path.exists():
-                        # Add failed downloads to wishlist
-                        self.__processFailedDownloadsToWishlist(str(log_path))
-                        # Remove successful downloads from wishlist
-                        self.__removeSuccessfulDownloadsFromWishlist(str(log_path))
-                
-                self.performSelectorOnMainThread_withObject_waitUntilDone_(
-                    "updateStatusText:", "Complete", False
-                )
-            else:
-                self.performSelectorOnMainThread_withObject_waitUntilDone_(
-                    "updateStatusText:", "CSV processing failed.", False
-                )
+            self._settings_save_scheduled = True
+        BACKGROUND_EXECUTOR.submit(self._writePendingSettings)
+
+    def _writePendingSettings(self):
+        """Write queued settings snapshots to disk until none are left (runs on BACKGROUND_EXECUTOR)."""
+        while True:
+            with self._settings_lock:
+                data = self._pending_settings
+                self._pending_settings = None
+                if data is None:
+                    self._settings_save_scheduled = False
+                    return
+            try:
+                write_json_atomic(SETTINGS_FILE, data, indent=2)
+                self._settings_cache = (_file_stamp(SETTINGS_FILE), data)
+            except Exception:
+                pass
 
-        except Exception as e:
-            print(f"An error occurred during CSV processing: {e}")
-            self.performSelectorOnMainThread_withObject_waitUntilDone_(
-                "updateStatusText:", "CSV processing error.", False
-            )
+    def save_settings(self):
+        """Public method to save settings."""
+        self.saveSettings()
 
-    def generate_manual_index_file(self):
+    def generate_manual_index_file(self, params):
         """Generate an index file manually when a download is stopped prematurely."""
-        self.performSelectorOnMainThread_withObject_waitUntilDone_(
-            "updateStatusText:", "Generating index for stopped download...", False
-        )
+        self._queueUIUpdate("updateStatusText_", "Generating index for stopped download...")
         
         try:
             if not self.download_target_dir:
-                self.performSelectorOnMainThread_withObject_waitUntilDone_(
-                    "appendOutput:", f"\n❌ Download target directory not set.\n", False
-                )
+                self._queueOutput(f"\n❌ Download target directory not set.\n")
                 return
 
 
 
             # Find the most recent processed CSV file (created by CSV processor)
-            csv_files = list(self.download_target_dir.rglob("*.csv"))
-            if not csv_files:
-                self.performSelectorOnMainThread_withObject_waitUntilDone_(
-                    "appendOutput:", f"\n❌ No processed CSV file found to append to.\n", False
-                )
+            newest_csv = _scan_for_newest_file(self.download_target_dir, None, lambda name: name.endswith(".csv"))
+            if not newest_csv:
+                self._queueOutput(f"\n❌ No processed CSV file found to append to.\n")
                 return
-            
-            # Use the most recent one
-            log_file = max(csv_files, key=lambda f: f.stat().st_mtime)
+            log_file = Path(newest_csv[1])
             
             # Get all tracks that should have been downloaded
-            all_tracks = self.__get_playlist_tracks()
+            all_tracks = self.__get_playlist_tracks(params)
             if not all_tracks:
                 # If we cannot retrieve playlist tracks at this point, silently skip augmentation
                 return
@@ -1884,45 +1995,37 @@ Cursor did all the rest, so a thank you to big ai, I guess?"""
             # Get successfully downloaded tracks from existing processed log (columns may be pruned)
             successful_tracks = self.__get_successful_tracks_from_processed_log(log_file)
             
-            # Find missing tracks
+            # Find missing tracks (successful_tracks is a set, so each lookup is O(1))
             missing_tracks = [track for track in all_tracks if track not in successful_tracks]
             
             if not missing_tracks:
-                self.performSelectorOnMainThread_withObject_waitUntilDone_(
-                    "appendOutput:", "\n✅ All tracks were successfully downloaded.\n", False
-                )
+                self._queueOutput("\n✅ All tracks were successfully downloaded.\n")
                 return
             
             # Append missing tracks to the processed log file
             self.__append_missing_tracks_to_processed_log(log_file, missing_tracks)
             
             # Process wishlist if mode is enabled
-            if self.wishlist_mode_checkbox.state():
+            if params['wishlist_mode']:
                 if log_file.exists():
-                    # Add failed downloads to wishlist
-                    self.__processFailedDownloadsToWishlist(str(log_file))
-                    # Remove successful downloads from wishlist
-                    self.__removeSuccessfulDownloadsFromWishlist(str(log_file))
+                    # Add failed downloads to wishlist and remove successful ones
+                    self.__syncWishlistWithLog(str(log_file))
             
-            self.performSelectorOnMainThread_withObject_waitUntilDone_(
-                "updateStatusText:", "Stopped", False
-            )
+            self._queueUIUpdate("updateStatusText_", "Stopped")
 
         except Exception as e:
-            self.performSelectorOnMainThread_withObject_waitUntilDone_(
-                "appendOutput:", f"\n❌ Error generating manual index file: {str(e)}\n", False
-            )
+            self._queueOutput(f"\n❌ Error generating manual index file: {str(e)}\n")
 
-    def __get_playlist_tracks(self):
-        """Get all tracks from the current playlist source."""
+    def __get_playlist_tracks(self, params):
+        """Get all tracks from the playlist source in the given form snapshot."""
         try:
-            selected_source = self.source_popup.titleOfSelectedItem()
+            selected_source = params['selected_source']
             
             if selected_source == "YouTube Playlist":
-                playlist_url = self.playlist_field.stringValue().strip()
+                playlist_url = params['playlist_url']
                 cmd = [str(self.sldl_path), playlist_url, '--print', 'tracks']
             elif selected_source == "Spotify Playlist":
-                playlist_url = self.spotify_field.stringValue().strip()
+                playlist_url = params['spotify_url']
                 cmd = [str(self.sldl_path), playlist_url, '--print', 'tracks']
             elif selected_source == "CSV File":
                 # Create temporary wishlist file from CSV in sldl format
@@ -1941,112 +2044,35 @@ Cursor did all the rest, so a thank you to big ai, I guess?"""
                 wishlist_file = temp_wishlist_file
                 cmd = [str(self.sldl_path), wishlist_file, '--input-type', 'string', '--print', 'tracks']
             
+            # The download fetches the playlist once for the session log; a stopped
+            # download asks again for the same list, so reuse it instead of re-running sldl
+            cache_key = tuple(cmd)
+            if self._playlist_tracks_cache and self._playlist_tracks_cache[0] == cache_key:
+                return list(self._playlist_tracks_cache[1])
+
             result = subprocess.run(cmd, capture_output=True, text=True, check=True, timeout=30)
             
             tracks = []
-            for line in result.stdout.strip().split('\n'):
-                if line.strip():
-                    # Extract track name from sldl output
-                    if ' - ' in line:
-                        # Remove duration if present (e.g., "Artist - Title (123s)" -> "Artist - Title")
-                        track_name = re.sub(r'\s*\(\d+s\)$', '', line.strip())
-                        tracks.append(track_name)
+            for line in result.stdout.splitlines():
+                line = line.strip()
+                # Extract track name from sldl output
+                if ' - ' in line:
+                    # Remove duration if present (e.g., "Artist - Title (123s)" -> "Artist - Title")
+                    tracks.append(TRACK_DURATION_RE.sub('', line))
             
-            return tracks
+            if tracks and selected_source in ("YouTube Playlist", "Spotify Playlist"):
+                self._playlist_tracks_cache = (cache_key, tracks)
+            return list(tracks)
             
         except Exception as e:
             print(f"Error getting playlist tracks: {e}")
             return []
 
-    def __get_successful_tracks_from_index(self, index_path):
-        """Extract successfully downloaded tracks from sldl index file."""
-        successful_tracks = []
-        try:
-            with open(index_path, 'r', encoding='utf-8') as f:
-                for line in f:
-                    line = line.strip()
-                    if not line or line.startswith('#'):
-                        continue
-                    
-                    # Parse the index line format
-                    parts = []
-                    current_part = ""
-                    in_quotes = False
-                    for char in line:
-                        if char == '"':
-                            in_quotes = not in_quotes
-                        elif char == ',' and not in_quotes:
-                            parts.append(current_part.strip())
-                            current_part = ""
-                        else:
-                            current_part += char
-                    parts.append(current_part.strip())
-                    
-                    if len(parts) >= 4:
-                        input_part = parts[0].strip('"')
-                        state = parts[3].strip('"')
-                        
-                        # Check if this is a successful download
-                        if state == "succeeded":
-                            # Extract the track name from the input
-                            if 'artist=' in input_part and 'title=' in input_part:
-                                # Parse structured input
-                                artist = ""
-                                title = ""
-                                for param in input_part.split(','):
-                                    if param.startswith('artist='):
-                                        artist = param.split('=', 1)[1].strip()
-                                    elif param.startswith('title='):
-                                        title = param.split('=', 1)[1].strip()
-                                
-                                if artist and title:
-                                    successful_tracks.append(f"{artist} - {title}")
-                            else:
-                                # Use the input as-is
-                                successful_tracks.append(input_part)
-                                
-        except Exception as e:
-            print(f"Error parsing index file: {e}")
-        
-        return successful_tracks
-
-    def __append_missing_tracks_to_index(self, index_path, missing_tracks):
-        """Append missing tracks to the existing index file."""
-        try:
-            with open(index_path, 'a', encoding='utf-8') as f:
-                for track in missing_tracks:
-                    # Parse artist and title from the track string
-                    artist = ""
-                    title = ""
-                    
-                    if ' - ' in track:
-                        # Format: "Artist - Title"
-                        artist, title = track.split(' - ', 1)
-                    elif 'artist=' in track and 'title=' in track:
-                        # Format: "artist=Artist,title=Title"
-                        for param in track.split(','):
-                            if param.startswith('artist='):
-                                artist = param.split('=', 1)[1].strip()
-                            elif param.startswith('title='):
-                                title = param.split('=', 1)[1].strip()
-                    else:
-                        # Fallback: use the whole track as title
-                        title = track
-                    
-                    # Write the missing track entry in the correct CSV format
-                    # Columns: filepath, artist, album, title, length, tracktype, state, failurereason
-                    f.write(f'"{artist} - {title}.mp3","{artist}","","{title}","","","failed","Download cancelled by user"\n')
-                    
-        except Exception as e:
-            print(f"Error appending to index file: {e}")
-            raise
-
     def __get_successful_tracks_from_processed_log(self, log_path):
-        """Extract successfully downloaded tracks from processed log.csv file."""
-        successful_tracks = []
+        """Return the set of successfully downloaded tracks in a processed log.csv file."""
+        successful_tracks = set()
         try:
-            import csv
-            with open(log_path, 'r', encoding='utf-8') as f:
+            with open(log_path, 'r', encoding='utf-8', buffering=CSV_IO_BUFFER) as f:
                 reader = csv.DictReader(f)
                 for row in reader:
                     # Check if this is a successful download
@@ -2056,9 +2082,9 @@ Cursor did all the rest, so a thank you to big ai, I guess?"""
                         title = row.get('title', '').strip()
                         
                         if artist and title:
-                            successful_tracks.append(f"{artist} - {title}")
+                            successful_tracks.add(f"{artist} - {title}")
                         elif title:
-                            successful_tracks.append(title)
+                            successful_tracks.add(title)
                                 
         except Exception as e:
             print(f"Error parsing processed log file: {e}")
@@ -2068,51 +2094,25 @@ Cursor did all the rest, so a thank you to big ai, I guess?"""
     def __append_missing_tracks_to_processed_log(self, log_path, missing_tracks):
         """Append missing tracks to the processed log.csv file with proper human-readable codes."""
         try:
-            import csv
-            # Read existing data to get fieldnames
-            with open(log_path, 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                fieldnames = reader.fieldnames or []
-
-            # Append missing tracks
-            with open(log_path, 'a', encoding='utf-8', newline='') as f:
-                writer = csv.DictWriter(f, fieldnames=fieldnames)
-
-                for track in missing_tracks:
-                    # Parse artist and title from the track string
-                    artist = ""
-                    title = ""
-
-                    if ' - ' in track:
-                        # Format: "Artist - Title"
-                        artist, title = track.split(' - ', 1)
-                    elif 'artist=' in track and 'title=' in track:
-                        # Format: "artist=Artist,title=Title"
-                        for param in track.split(','):
-                            if param.startswith('artist='):
-                                artist = param.split('=', 1)[1].strip()
-                            elif param.startswith('title='):
-                                title = param.split('=', 1)[1].strip()
-                    else:
-                        # Fallback: use the whole track as title
-                        title = track
-
-                    # Build a row using only columns that exist in the processed log
-                    candidate_row = {
-                        'artist': artist,
-                        'title': title,
-                        'state': '2',
-                        'failurereason': '6',
-                        'state_description': 'Failed',
-                        'failure_description': 'Download cancelled by user'
-                    }
-                    # Keep only keys present in fieldnames
-                    safe_row = {k: v for k, v in candidate_row.items() if k in fieldnames}
-                    # Ensure any missing columns that exist in fieldnames are present with empty values
-                    for col in fieldnames:
-                        if col not in safe_row:
-                            safe_row[col] = ''
-                    writer.writerow(safe_row)
+            # Columns the processed log lacks are dropped and the rest left empty
+            rows = [
+                {
+                    'artist': artist,
+                    'title': title,
+                    'state': '2',
+                    'failurereason': '6',
+                    'state_description': 'Failed',
+                    'failure_description': 'Download cancelled by user'
+                }
+                for artist, title in map(split_track_name, missing_tracks)
+            ]
+
+            # Read the header and append through one handle
+            with open(log_path, 'r+', encoding='utf-8', newline='', buffering=CSV_IO_BUFFER) as f:
+                fieldnames = next(csv.reader(f), [])
+                f.seek(0, os.SEEK_END)
+                writer = csv.DictWriter(f, fieldnames=fieldnames, restval='', extrasaction='ignore')
+                writer.writerows(rows)
                     
         except Exception as e:
             print(f"Error appending to processed log file: {e}")
@@ -2126,22 +2126,11 @@ Cursor did all the rest, so a thank you to big ai, I guess?"""
         
         if selected_source == "YouTube Playlist":
             playlist_url = self.playlist_field.stringValue().strip()
-            if not playlist_url:
-                self.showAlert_message_("Error", "Please enter a YouTube playlist URL.")
-                return
-            # Basic YouTube URL validation
-            if not any(pattern in playlist_url.lower() for pattern in ['youtube.com', 'youtu.be']):
-                self.showAlert_message_("Error", "Please enter a valid YouTube playlist URL.")
-                return
         else:  # Spotify Playlist
+            selected_source = "Spotify Playlist"
             playlist_url = self.spotify_field.stringValue().strip()
-            if not playlist_url:
-                self.showAlert_message_("Error", "Please enter a Spotify playlist URL.")
-                return
-            # Basic Spotify URL validation
-            if not any(pattern in playlist_url.lower() for pattern in ['spotify.com', 'open.spotify.com']):
-                self.showAlert_message_("Error", "Please enter a valid Spotify playlist URL.")
-                return
+        if not self._validatePlaylistUrl(selected_source, playlist_url):
+            return
         
         # Get target directory
         download_path_str = self.path_field.stringValue().strip()
@@ -2161,13 +2150,10 @@ Cursor did all the rest, so a thank you to big ai, I guess?"""
     def __exportPlaylistToCSV(self, playlist_url, source_type, target_directory):
         """Export playlist to CSV file in background thread."""
         try:
-            self.performSelectorOnMainThread_withObject_waitUntilDone_(
-                "updateStatusText:", f"Exporting {source_type} to CSV...", False
-            )
+            self._queueUIUpdate("updateStatusText_", f"Exporting {source_type} to CSV...")
             
             # Generate filename based on source type and current timestamp
-            import datetime
-            timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+            timestamp = time.strftime("%Y%m%d_%H%M%S")
             if source_type == "YouTube Playlist":
                 filename = f"youtube_playlist_{timestamp}.csv"
             else:
@@ -2183,166 +2169,121 @@ Cursor did all the rest, so a thank you to big ai, I guess?"""
                 success = self.__exportSpotifyPlaylistToCSV(playlist_url, csv_path)
             
             if success:
-                self.performSelectorOnMainThread_withObject_waitUntilDone_(
-                    "updateStatusText:", f"CSV exported to: {csv_path}", False
-                )
-                self.performSelectorOnMainThread_withObject_waitUntilDone_(
-                    "appendOutput:", f"\n✅ CSV exported successfully to: {csv_path}\n", False
-                )
+                self._queueUIUpdate("updateStatusText_", f"CSV exported to: {csv_path}")
+                self._queueOutput(f"\n✅ CSV exported successfully to: {csv_path}\n")
             else:
-                self.performSelectorOnMainThread_withObject_waitUntilDone_(
-                    "updateStatusText:", "CSV export failed", False
-                )
-                self.performSelectorOnMainThread_withObject_waitUntilDone_(
-                    "appendOutput:", f"\n❌ Failed to export CSV\n", False
-                )
+                self._queueUIUpdate("updateStatusText_", "CSV export failed")
+                self._queueOutput(f"\n❌ Failed to export CSV\n")
                 
         except Exception as e:
-            self.performSelectorOnMainThread_withObject_waitUntilDone_(
-                "updateStatusText:", f"CSV export error: {str(e)}", False
-            )
-            self.performSelectorOnMainThread_withObject_waitUntilDone_(
-                "appendOutput:", f"\n❌ CSV export error: {str(e)}\n", False
-            )
+            self._queueUIUpdate("updateStatusText_", f"CSV export error: {str(e)}")
+            self._queueOutput(f"\n❌ CSV export error: {str(e)}\n")
+
+    def __writePrintedTracksToCSV(self, playlist_url, csv_path, fieldnames, make_row):
+        """Stream `sldl --print tracks` output into a CSV file, one row per track line.
+
+        Rows are written as sldl prints them instead of buffering the whole
+        listing. Raises subprocess.CalledProcessError (with sldl's stderr) and
+        removes the partial CSV if sldl fails.
+        """
+        cmd = [str(self.sldl_path), playlist_url, '--print', 'tracks']
+        # Decode as UTF-8 regardless of locale, like the download output, so
+        # track names with non-ASCII characters can't end the export early
+        with tempfile.TemporaryFile(mode='w+', encoding='utf-8', errors='replace') as stderr_file:
+            with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=stderr_file,
+                                  encoding='utf-8', errors='replace') as process:
+                with open(csv_path, 'w', newline='', encoding='utf-8') as csvfile:
+                    writer = csv.writer(csvfile)
+                    writer.writerow(fieldnames)
+                    for match in map(TRACK_LINE_RE.match, process.stdout):
+                        if match:
+                            writer.writerow(make_row(match))
+                return_code = process.wait()
+
+            if return_code:
+                Path(csv_path).unlink(missing_ok=True)
+                stderr_file.seek(0)
+                raise subprocess.CalledProcessError(return_code, cmd, stderr=stderr_file.read())
 
     def __exportYouTubePlaylistToCSV(self, playlist_url, csv_path):
         """Export YouTube playlist to CSV using sldl."""
         try:
-            # Use sldl to get playlist tracks without downloading
-            cmd = [str(self.sldl_path), playlist_url, '--print', 'tracks']
-            
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-            
-            # Parse the output and create CSV
-            import csv
-            tracks = []
-            
-            for line in result.stdout.strip().split('\n'):
-                if line.strip():
-                    # sldl output format: "Artist - Title (duration)"
-                    # Example: "Yes Theory - I Explored A $200,000,000 Forgotten Space Colony (969s)"
-                    if ' - ' in line and '(' in line and ')' in line:
-                        # Extract artist and title
-                        artist_title_part = line.split(' (')[0]
-                        if ' - ' in artist_title_part:
-                            artist, title = artist_title_part.split(' - ', 1)
-                            
-                            # Extract duration (remove 's' suffix and convert to MM:SS)
-                            duration_match = re.search(r'\((\d+)s\)', line)
-                            duration_formatted = ""
-                            if duration_match:
-                                duration_seconds = int(duration_match.group(1))
-                                duration_minutes = duration_seconds // 60
-                                duration_remaining_seconds = duration_seconds % 60
-                                duration_formatted = f"{duration_minutes}:{duration_remaining_seconds:02d}"
-                            
-                            tracks.append({
-                                'title': title.strip(),
-                                'artist': artist.strip(),
-                                'duration': duration_formatted,
-                                'url': playlist_url,  # Use the playlist URL as the source
-                                'uploader': artist.strip()  # Use artist as uploader
-                            })
-            
-            # Write to CSV
-            with open(csv_path, 'w', newline='', encoding='utf-8') as csvfile:
-                fieldnames = ['title', 'artist', 'duration', 'url', 'uploader']
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                writer.writeheader()
-                writer.writerows(tracks)
-            
+            # sldl output format: "Artist - Title (duration)"
+            # Example: "Yes Theory - I Explored A $200,000,000 Forgotten Space Colony (969s)"
+            def make_row(match):
+                artist = match['artist'].strip()
+                # Columns: title, artist, duration, url (playlist as source), uploader (artist)
+                return (
+                    match['title'].strip(),
+                    artist,
+                    format_duration(match['duration']),
+                    playlist_url,
+                    artist,
+                )
+
+            self.__writePrintedTracksToCSV(playlist_url, csv_path, YOUTUBE_EXPORT_FIELDS, make_row)
             return True
             
         except subprocess.CalledProcessError as e:
             error_msg = e.stderr if e.stderr else str(e)
-            self.performSelectorOnMainThread_withObject_waitUntilDone_(
-                "appendOutput:", f"❌ sldl error: {error_msg}\n", False
-            )
+            self._queueOutput(f"❌ sldl error: {error_msg}\n")
             return False
         except Exception as e:
-            self.performSelectorOnMainThread_withObject_waitUntilDone_(
-                "appendOutput:", f"❌ YouTube export error: {str(e)}\n", False
-            )
+            self._queueOutput(f"❌ YouTube export error: {str(e)}\n")
             return False
 
     def __exportSpotifyPlaylistToCSV(self, playlist_url, csv_path):
         """Export Spotify playlist to CSV using sldl."""
         try:
-            # Use sldl to get playlist tracks without downloading
-            cmd = [str(self.sldl_path), playlist_url, '--print', 'tracks']
-            
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-            
-            # Parse the output and create CSV
-            import csv
-            tracks = []
-            
-            for line in result.stdout.strip().split('\n'):
-                if line.strip():
-                    # sldl output format: "Artist - Title" or "Title - Artist"
-                    # We'll parse this as best we can
-                    if ' - ' in line:
-                        parts = line.split(' - ', 1)
-                        if len(parts) == 2:
-                            # Try to determine which is artist and which is title
-                            # This is a simple heuristic - could be improved
-                            artist, title = parts[0].strip(), parts[1].strip()
-                            
-                            # Strip duration from title (e.g., "Song Name (148s)" -> "Song Name")
-                            title_clean = re.sub(r'\s*\(\d+s\)$', '', title)
-                            
-                            tracks.append({
-                                'title': title_clean,
-                                'artist': artist,
-                                'album': '',  # sldl doesn't provide album info in track listing
-                                'duration': '',  # sldl doesn't provide duration in track listing
-                                'url': playlist_url  # Use the playlist URL as the source
-                            })
-            
-            # Write to CSV
-            with open(csv_path, 'w', newline='', encoding='utf-8') as csvfile:
-                fieldnames = ['title', 'artist', 'album', 'duration', 'url']
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                writer.writeheader()
-                writer.writerows(tracks)
-            
+            # sldl output format: "Artist - Title" with an optional "(148s)" duration,
+            # which is stripped from the title
+            def make_row(match):
+                # Columns: title, artist, album, duration, url (playlist as source);
+                # sldl doesn't provide album or duration info in the track listing
+                return (
+                    match['title'].strip(),
+                    match['artist'].strip(),
+                    '',
+                    '',
+                    playlist_url,
+                )
+
+            self.__writePrintedTracksToCSV(playlist_url, csv_path, SPOTIFY_EXPORT_FIELDS, make_row)
             return True
             
         except subprocess.CalledProcessError as e:
             error_msg = e.stderr if e.stderr else str(e)
             
             # Check for specific Spotify authentication errors
-            if "not found" in error_msg.lower() and "private" in error_msg.lower():
-                self.performSelectorOnMainThread_withObject_waitUntilDone_(
-                    "appendOutput:", "❌ Spotify playlist not found or is private. Spotify playlists require authentication.\n", False
-                )
-            elif "invalid_client" in error_msg.lower():
-                self.performSelectorOnMainThread_withObject_waitUntilDone_(
-                    "appendOutput:", "❌ Spotify authentication failed. The playlist may be private or require valid credentials.\n", False
-                )
+            lowered_msg = error_msg.lower()
+            if "not found" in lowered_msg and "private" in lowered_msg:
+                self._queueOutput("❌ Spotify playlist not found or is private. Spotify playlists require authentication.\n")
+            elif "invalid_client" in lowered_msg:
+                self._queueOutput("❌ Spotify authentication failed. The playlist may be private or require valid credentials.\n")
             else:
-                self.performSelectorOnMainThread_withObject_waitUntilDone_(
-                    "appendOutput:", f"❌ sldl error: {error_msg}\n", False
-                )
+                self._queueOutput(f"❌ sldl error: {error_msg}\n")
             return False
         except Exception as e:
-            self.performSelectorOnMainThread_withObject_waitUntilDone_(
-                "appendOutput:", f"❌ Spotify export error: {str(e)}\n", False
-            )
+            self._queueOutput(f"❌ Spotify export error: {str(e)}\n")
             return False
 
     def check_for_updates_async(self):
-        """Check for updates in a background thread to avoid blocking the UI."""
-        def update_check_thread():
-            latest_version = check_for_updates()
+        """Check for updates on the shared background executor to avoid blocking the UI."""
+        def update_check_done(future):
+            try:
+                latest_version = future.result()
+            except Exception as e:
+                print(f"Error checking for updates: {e}")
+                return
             if latest_version:
                 # Show update alert on main thread
                 self.performSelectorOnMainThread_withObject_waitUntilDone_(
                     "showUpdateAlert:", latest_version, False
                 )
-        
-        # Start update check in background thread
-        threading.Thread(target=update_check_thread, daemon=True).start()
+
+        # The socket I/O inside urlopen releases the GIL, so the main run loop keeps
+        # running; NETWORK_TIMEOUT bounds how long the worker can be held up
+        BACKGROUND_EXECUTOR.submit(check_for_updates).add_done_callback(update_check_done)
 
 
 
@@ -2437,22 +2378,16 @@ Cursor did all the rest, so a thank you to big ai, I guess?"""
                 self.showAlert_message_("Error", "The directory ~/.SoulseekQT was not found.")
                 return
             
-            # Recursively find all files and pick the most recently created/modified
-            import os
-            candidates = [p for p in base_dir.rglob('*') if p.is_file()]
-            if not candidates:
+            # Recursively find the most recently created file, statting each file once.
+            # Prefer birth time when available (macOS), fallback to mtime
+            newest = _scan_for_newest_file(
+                base_dir, None, lambda name: True,
+                file_time=lambda st: getattr(st, 'st_birthtime', st.st_mtime),
+            )
+            if not newest:
                 self.showAlert_message_("Error", "No files found under ~/.SoulseekQT.")
                 return
-            
-            def file_time(path_obj):
-                try:
-                    st = os.stat(path_obj)
-                    # Prefer birth time when available (macOS), fallback to mtime
-                    return getattr(st, 'st_birthtime', st.st_mtime)
-                except Exception:
-                    return 0
-            
-            latest_file = max(candidates, key=file_time)
+            latest_file = Path(newest[1])
             
             # Use system 'strings' to extract human-readable strings
             strings_path = "/usr/bin/strings"
@@ -2493,7 +2428,6 @@ Cursor did all the rest, so a thank you to big ai, I guess?"""
         items = []
         if WISHLIST_FILE.exists():
             try:
-                import csv
                 with open(WISHLIST_FILE, 'r', newline='', encoding='utf-8') as csvfile:
                     reader = csv.DictReader(csvfile)
                     for row in reader:
@@ -2513,7 +2447,7 @@ Cursor did all the rest, so a thank you to big ai, I guess?"""
                 print(f"Error loading wishlist: {e}")
         return items
 
-    def __createCSVFileFromWishlist(self):
+    def __createCSVFileFromWishlist(self, clean_enabled):
         """Create a temporary CSV file from wishlist for sldl csv input type."""
         try:
             wishlist_items = self.__loadWishlistItems()
@@ -2523,14 +2457,11 @@ Cursor did all the rest, so a thank you to big ai, I guess?"""
                 return None
             
             # Create a temporary CSV file with artist and title columns
-            import tempfile
-            import csv
             temp_file = tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False, encoding='utf-8', newline='')
             
             writer = csv.writer(temp_file)
             writer.writerow(['artist', 'title'])  # CSV header
             
-            clean_enabled = bool(self.clean_search_checkbox.state())
             for item in wishlist_items:
                 if ' - ' in item:
                     artist, title = item.split(' - ', 1)
@@ -2549,7 +2480,6 @@ Cursor did all the rest, so a thank you to big ai, I guess?"""
             print(f"Created CSV file: {temp_file.name}")
             
             # Verify the file was created and has content
-            import os
             if os.path.exists(temp_file.name):
                 with open(temp_file.name, 'r', encoding='utf-8') as f:
                     content = f.read()
@@ -2573,18 +2503,14 @@ Cursor did all the rest, so a thank you to big ai, I guess?"""
             # Normalize and strip diacritics
             normalized = unicodedata.normalize('NFKD', str(text))
             ascii_text = normalized.encode('ascii', 'ignore').decode('ascii')
-            # Replace non-alphanumeric with space, collapse whitespace
-            ascii_text = re.sub(r'[^A-Za-z0-9]+', ' ', ascii_text)
-            ascii_text = re.sub(r'\s+', ' ', ascii_text).strip()
-            return ascii_text
+            # Replace each run of non-alphanumerics (whitespace included) with a single space
+            return NON_ALNUM_RUN_RE.sub(' ', ascii_text).strip()
         except Exception:
             return str(text)
 
     def __createSanitizedCopyOfCSV(self, csv_path):
         """Create a sanitized temporary CSV from the provided CSV file based on checkbox setting."""
         try:
-            import csv
-            import tempfile
             with open(csv_path, 'r', newline='', encoding='utf-8') as infile:
                 reader = csv.DictReader(infile)
                 fieldnames = reader.fieldnames or []
@@ -2625,8 +2551,7 @@ Cursor did all the rest, so a thank you to big ai, I guess?"""
     def __saveWishlistItems(self, items):
         """Save wishlist items to CSV file."""
         try:
-            import csv
-            with open(WISHLIST_FILE, 'w', newline='', encoding='utf-8') as csvfile:
+            with open(WISHLIST_FILE, 'w', newline='', encoding='utf-8', buffering=CSV_IO_BUFFER) as csvfile:
                 fieldnames = ['artist', 'title']
                 writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
                 writer.writeheader()
@@ -2699,7 +2624,6 @@ Cursor did all the rest, so a thank you to big ai, I guess?"""
                 
                 # Save directly to user-selected location
                 try:
-                    import csv
                     with open(export_path, 'w', newline='', encoding='utf-8') as csvfile:
                         fieldnames = ['artist', 'title']
                         writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
@@ -2728,7 +2652,6 @@ Cursor did all the rest, so a thank you to big ai, I guess?"""
     def __importWishlistFromCSV(self, csv_path):
         """Import tracks from CSV file to wishlist."""
         try:
-            import csv
             items_to_import = []
             
             with open(csv_path, 'r', newline='', encoding='utf-8') as csvfile:
@@ -2746,50 +2669,56 @@ Cursor did all the rest, so a thank you to big ai, I guess?"""
         except Exception as e:
             raise Exception(f"Failed to import CSV: {e}")
 
-    def __processFailedDownloadsToWishlist(self, log_path):
-        """Process failed downloads from log.csv and add to wishlist."""
+    def __syncWishlistWithLog(self, log_path):
+        """Read log.csv once, add its failed downloads to the wishlist and remove its successful ones."""
+        try:
+            with open(log_path, 'r', newline='', encoding='utf-8', buffering=CSV_IO_BUFFER) as csvfile:
+                rows = list(csv.DictReader(csvfile))
+        except Exception as e:
+            print(f"Error reading log for wishlist update: {e}")
+            return
+        self.__processFailedDownloadsToWishlist(rows)
+        self.__removeSuccessfulDownloadsFromWishlist(rows)
+
+    def __processFailedDownloadsToWishlist(self, log_rows):
+        """Add the failed downloads among log.csv rows to the wishlist."""
         try:
-            import csv
             failed_items = []
             wishlist_items = set(self.__loadWishlistItems())
             
-            with open(log_path, 'r', newline='', encoding='utf-8') as csvfile:
-                reader = csv.DictReader(csvfile)
-                for row in reader:
-                    # Check if this is a failed download
-                    state = row.get('state', '')
-                    state_desc = row.get('state_description', '')
-                    failure_desc = row.get('failure_description', '')
+            for row in log_rows:
+                # Check if this is a failed download
+                state = row.get('state', '')
+                state_desc = row.get('state_description', '')
+                failure_desc = row.get('failure_description', '')
+                
+                if (state == '2' or state_desc == 'Failed' or 
+                    'Failed' in failure_desc or 'cancelled' in failure_desc.lower()):
                     
-                    if (state == '2' or state_desc == 'Failed' or 
-                        'Failed' in failure_desc or 'cancelled' in failure_desc.lower()):
-                        
-                        # Use smart cross-referencing to check if already in wishlist
-                        matched_item = self.__smartCrossReference(row, wishlist_items)
+                    # Use smart cross-referencing to check if already in wishlist
+                    matched_item = self.__smartCrossReference(row, wishlist_items)
+                    
+                    # If not already in wishlist, add it
+                    if not matched_item:
+                        artist = row.get('artist', '')
+                        title = row.get('title', '')
+                        combined_string = row.get('combined_string', '')
                         
-                        # If not already in wishlist, add it
-                        if not matched_item:
-                            artist = row.get('artist', '')
-                            title = row.get('title', '')
-                            combined_string = row.get('combined_string', '')
-                            
-                            # Handle different formats: artist-title, title-only, or combined_string
-                            if artist and title:
-                                # Both artist and title present
-                                failed_items.append(f"{artist} - {title}")
-                            elif title and not artist:
-                                # Title-only (from CSV with only title column)
-                                failed_items.append(title)
-                            elif combined_string and not artist and not title:
-                                # Combined string only (fallback)
-                                failed_items.append(combined_string)
-            
+                        # Handle different formats: artist-title, title-only, or combined_string
+                        if artist and title:
+                            # Both artist and title present
+                            failed_items.append(f"{artist} - {title}")
+                        elif title and not artist:
+                            # Title-only (from CSV with only title column)
+                            failed_items.append(title)
+                        elif combined_string and not artist and not title:
+                            # Combined string only (fallback)
+                            failed_items.append(combined_string)
+        
             if failed_items:
                 added_count = self.__addToWishlist(failed_items)
                 if added_count > 0:
-                    self.performSelectorOnMainThread_withObject_waitUntilDone_(
-                        "appendOutput:", f"\n📝 Added {added_count} failed downloads to wishlist.\n", False
-                    )
+                    self._queueOutput(f"\n📝 Added {added_count} failed downloads to wishlist.\n")
                     
         except Exception as e:
             print(f"Error processing failed downloads to wishlist: {e}")
@@ -2844,32 +2773,27 @@ Cursor did all the rest, so a thank you to big ai, I guess?"""
                 return match
         return None
 
-    def __removeSuccessfulDownloadsFromWishlist(self, log_path):
-        """Remove successfully downloaded tracks from wishlist."""
+    def __removeSuccessfulDownloadsFromWishlist(self, log_rows):
+        """Remove the successful downloads among log.csv rows from the wishlist."""
         try:
-            import csv
             successful_items = []
             wishlist_items = set(self.__loadWishlistItems())
             
-            with open(log_path, 'r', newline='', encoding='utf-8') as csvfile:
-                reader = csv.DictReader(csvfile)
-                for row in reader:
-                    # Check if this is a successful download
-                    state = row.get('state', '')
-                    state_desc = row.get('state_description', '')
-                    
-                    if (state == '1' or state_desc == 'Downloaded'):
-                        # Use smart cross-referencing to find matches
-                        matched_item = self.__smartCrossReference(row, wishlist_items)
-                        if matched_item:
-                            successful_items.append(matched_item)
-            
+            for row in log_rows:
+                # Check if this is a successful download
+                state = row.get('state', '')
+                state_desc = row.get('state_description', '')
+                
+                if (state == '1' or state_desc == 'Downloaded'):
+                    # Use smart cross-referencing to find matches
+                    matched_item = self.__smartCrossReference(row, wishlist_items)
+                    if matched_item:
+                        successful_items.append(matched_item)
+        
             if successful_items:
                 removed_count = self.__removeFromWishlist(successful_items)
                 if removed_count > 0:
-                    self.performSelectorOnMainThread_withObject_waitUntilDone_(
-                        "appendOutput:", f"\n✅ Removed {removed_count} successful downloads from wishlist.\n", False
-                    )
+                    self._queueOutput(f"\n✅ Removed {removed_count} successful downloads from wishlist.\n")
                     
         except Exception as e:
             print(f"Error removing successful downloads from wishlist: {e}")